@@ -81,7 +81,9 @@ def serve(
         else "INFO" if not quiet else "WARNING"
     )
     logger = setup_logging(
-        level=log_level, rich_output=not stdio
+        level=log_level,
+        rich_output=False if stdio else None,
+        background=bool(http_port),
     )
 
     path_obj = Path(path)
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import asyncio
 import sys
 from pathlib import Path
 from typing import Optional
@@ -9,6 +8,7 @@ import click
 
 from ... import __version__
 from ...logging import setup_logging
+from ...utilities import run_event_loop
 from .. import cli, console
 from ..branding import BannerRenderer, StatusPrinter
 from ..formatting import RichCommand
@@ -54,9 +54,7 @@ def test(
     )
 
     path_obj = Path(path)
-    logger = setup_logging(
-        level="WARNING", rich_output=True
-    )
+    logger = setup_logging(level="WARNING")
 
     server = _loader_registry.load(path_obj, logger)
     if not server:
@@ -70,5 +68,7 @@ def test(
         f"Event type: [cyan]{event}[/cyan]", "info"
     )
 
-    verdicts = asyncio.run(server.evaluate(test_event))
+    verdicts = run_event_loop(
+        server.evaluate(test_event)
+    )
     _verdict_renderer.render(verdicts)
@@ -5,12 +5,14 @@ from rich.console import Console
 from rich.panel import Panel
 from rich.table import Table
 
+from ...types import Decision
+
 DECISION_STYLE_MAP = {
-    "allow": "[green]ALLOW[/green]",
-    "deny": "[red]DENY[/red]",
-    "modify": "[yellow]MODIFY[/yellow]",
-    "escalate": "[magenta]ESCALATE[/magenta]",
-    "observe": "[blue]OBSERVE[/blue]",
+    Decision.ALLOW: "[green]ALLOW[/green]",
+    Decision.DENY: "[red]DENY[/red]",
+    Decision.MODIFY: "[yellow]MODIFY[/yellow]",
+    Decision.ESCALATE: "[magenta]ESCALATE[/magenta]",
+    Decision.OBSERVE: "[blue]OBSERVE[/blue]",
 }
 
 
@@ -41,7 +43,7 @@ class VerdictTableRenderer:
 
         for v in verdicts:
             decision_display = DECISION_STYLE_MAP.get(
-                v.decision.value, v.decision.value
+                v.decision, v.decision.value
             )
             timing_display = (
                 f"{v.evaluation_ms:.2f}ms"
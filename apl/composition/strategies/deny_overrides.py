@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from apl.types import Decision, Verdict
+from apl.types import Decision, Modification, Verdict
 
 from .base_strategy import BaseCompositionStrategy
 
@@ -21,25 +21,46 @@ class DenyOverridesStrategy(BaseCompositionStrategy):
         if guard is not None:
             return guard
 
-        deny = self._find_first_verdict_with_decision(
-            verdicts, Decision.DENY
-        )
-        if deny is not None:
-            return deny
+        escalate: Verdict | None = None
+        mods_by_target: dict[str, Modification] = {}
+        modify_reasons: list[str] = []
+
+        for verdict in verdicts:
+            decision = verdict.decision
+            if decision == Decision.DENY:
+                return verdict
+            if decision == Decision.OBSERVE:
+                continue
+            if (
+                decision == Decision.ESCALATE
+                and escalate is None
+            ):
+                escalate = verdict
+            for mod in verdict.modifications:
+                mods_by_target[mod.target] = mod
+            if (
+                decision == Decision.MODIFY
+                and verdict.reasoning
+            ):
+                modify_reasons.append(
+                    verdict.reasoning
+                )
 
-        escalate = (
-            self._find_first_verdict_with_decision(
-                verdicts, Decision.ESCALATE
-            )
-        )
         if escalate is not None:
             return escalate
 
-        modified = self._build_modified_verdict(
-            verdicts
-        )
-        if modified is not None:
-            return modified
+        if mods_by_target:
+            return Verdict(
+                decision=Decision.MODIFY,
+                reasoning=(
+                    " + ".join(modify_reasons)
+                    if modify_reasons
+                    else None
+                ),
+                modifications=list(
+                    mods_by_target.values()
+                ),
+            )
 
         return Verdict.allow(
             reasoning=self._allow_reasoning
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from apl.types import Decision, Verdict
+from apl.types import Decision, Modification, Verdict
 
 from .base_strategy import BaseCompositionStrategy
 
@@ -14,46 +14,40 @@ class WeightedStrategy(BaseCompositionStrategy):
         if guard is not None:
             return guard
 
-        all_mods = self._collect_all_modifications(
-            verdicts
-        )
-
-        escalate = (
-            self._find_first_verdict_with_decision(
-                verdicts, Decision.ESCALATE
-            )
-        )
-        if escalate is not None:
-            return escalate
-
-        allow_score = sum(
-            v.confidence
-            for v in verdicts
-            if v.decision == Decision.ALLOW
-        )
-        deny_score = sum(
-            v.confidence
-            for v in verdicts
-            if v.decision == Decision.DENY
-        )
+        allow_score = 0.0
+        deny_score = 0.0
+        first_deny: Verdict | None = None
+        mods_by_target: dict[str, Modification] = {}
+
+        for verdict in verdicts:
+            decision = verdict.decision
+            if decision == Decision.ESCALATE:
+                return verdict
+            if decision == Decision.OBSERVE:
+                continue
+            if decision == Decision.ALLOW:
+                allow_score += verdict.confidence
+            elif decision == Decision.DENY:
+                deny_score += verdict.confidence
+                if first_deny is None:
+                    first_deny = verdict
+            for mod in verdict.modifications:
+                mods_by_target[mod.target] = mod
 
         if deny_score > allow_score:
-            deny = (
-                self._find_first_verdict_with_decision(
-                    verdicts, Decision.DENY
-                )
-            )
-            if deny is not None:
-                return deny
+            if first_deny is not None:
+                return first_deny
             return Verdict.deny(
                 reasoning=f"Weighted deny ({deny_score:.2f} vs {allow_score:.2f})"
             )
 
-        if all_mods:
+        if mods_by_target:
             return Verdict(
                 decision=Decision.MODIFY,
                 reasoning=f"Weighted allow ({allow_score:.2f} vs {deny_score:.2f})",
-                modifications=all_mods,
+                modifications=list(
+                    mods_by_target.values()
+                ),
             )
 
         return Verdict.allow(
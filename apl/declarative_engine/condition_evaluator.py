@@ -1,11 +1,106 @@
 from __future__ import annotations
 
 import re
+from functools import lru_cache
 from typing import Any, Callable
 
 ConditionHandler = Callable[[Any, Any], bool]
 
 
+@lru_cache(maxsize=256)
+def _compile_case_insensitive(
+    pattern: str,
+) -> re.Pattern[str]:
+    return re.compile(pattern, re.IGNORECASE)
+
+
+@lru_cache(maxsize=256)
+def _compile_alternation(
+    needles: tuple[str, ...],
+) -> re.Pattern[str]:
+    return re.compile(
+        "|".join(
+            re.escape(needle) for needle in needles
+        )
+    )
+
+
+def prepare_when_clause(
+    when: dict[str, Any],
+) -> dict[str, Any]:
+    return {
+        dot_path: prepare_condition(condition)
+        for dot_path, condition in when.items()
+    }
+
+
+def prepare_condition(condition: Any) -> Any:
+    """
+    Rewrite a parsed condition into a form that is cheaper to
+    evaluate: ``in:`` lists become frozensets and an ``any:`` of
+    plain string ``contains:`` checks becomes one alternation.
+
+    Only operator positions are rewritten; the arguments of
+    ``equals`` and of unknown operators are literals and are
+    left untouched.
+    """
+    if not isinstance(condition, dict):
+        return condition
+    return {
+        operator_name: _prepare_operand(
+            operator_name, argument
+        )
+        for operator_name, argument in condition.items()
+    }
+
+
+def _prepare_operand(
+    operator_name: str, argument: Any
+) -> Any:
+    if operator_name == "in":
+        return _as_frozenset(argument)
+    if operator_name == "not":
+        return prepare_condition(argument)
+    if operator_name in ("any", "all") and isinstance(
+        argument, list
+    ):
+        if operator_name == "any":
+            needles = _plain_contains_needles(argument)
+            if needles is not None:
+                return [{"contains_any": needles}]
+        return [prepare_condition(c) for c in argument]
+    return argument
+
+
+def _as_frozenset(values: Any) -> Any:
+    if not isinstance(values, list):
+        return values
+    try:
+        return frozenset(values)
+    except TypeError:
+        return values
+
+
+def _plain_contains_needles(
+    conditions: Any,
+) -> tuple[str, ...] | None:
+    if (
+        not isinstance(conditions, list)
+        or not conditions
+    ):
+        return None
+    needles = []
+    for c in conditions:
+        if not (
+            isinstance(c, dict)
+            and c.keys() == {"contains"}
+            and isinstance(c["contains"], str)
+        ):
+            return None
+        needles.append(c["contains"])
+    return tuple(needles)
+
+
 class ConditionEvaluator:
 
     def __init__(self) -> None:
@@ -15,6 +110,7 @@ class ConditionEvaluator:
             "equals": self._handle_equals,
             "matches": self._handle_regex_match,
             "contains": self._handle_contains,
+            "contains_any": self._handle_contains_any,
             "gt": self._handle_greater_than,
             "gte": self._handle_greater_than_or_equal,
             "lt": self._handle_less_than,
@@ -77,8 +173,8 @@ class ConditionEvaluator:
         if value is None:
             return False
         return bool(
-            re.match(
-                pattern, str(value), re.IGNORECASE
+            _compile_case_insensitive(pattern).match(
+                str(value)
             )
         )
 
@@ -94,6 +190,25 @@ class ConditionEvaluator:
             return needle in value
         return False
 
+    @staticmethod
+    def _handle_contains_any(
+        value: Any, needles: tuple[str, ...]
+    ) -> bool:
+        if value is None:
+            return False
+        if isinstance(value, str):
+            return (
+                _compile_alternation(
+                    tuple(needles)
+                ).search(value)
+                is not None
+            )
+        if isinstance(value, (list, tuple, set, dict)):
+            return any(
+                needle in value for needle in needles
+            )
+        return False
+
     @staticmethod
     def _handle_greater_than(
         value: Any, threshold: Any
@@ -120,9 +235,13 @@ class ConditionEvaluator:
 
     @staticmethod
     def _handle_membership(
-        value: Any, allowed_values: list[Any]
+        value: Any,
+        allowed_values: list[Any] | frozenset[Any],
     ) -> bool:
-        return value in allowed_values
+        try:
+            return value in allowed_values
+        except TypeError:
+            return False
 
     def _handle_negation(
         self, value: Any, inner_condition: Any
@@ -30,9 +30,10 @@ class RuleEvaluator:
         self,
         rule: YAMLRule,
         event: PolicyEvent,
+        resolved_paths: dict[str, Any] | None = None,
     ) -> Verdict | None:
         if not self._all_conditions_match(
-            rule.when, event
+            rule.when, event, resolved_paths
         ):
             return None
 
@@ -44,13 +45,24 @@ class RuleEvaluator:
         self,
         when_clause: dict[str, Any],
         event: PolicyEvent,
+        resolved_paths: dict[str, Any] | None = None,
     ) -> bool:
         for dot_path, condition in when_clause.items():
-            actual_value = (
-                get_nested_value_by_dot_path(
-                    event, dot_path
+            if (
+                resolved_paths is not None
+                and dot_path in resolved_paths
+            ):
+                actual_value = resolved_paths[dot_path]
+            else:
+                actual_value = (
+                    get_nested_value_by_dot_path(
+                        event, dot_path
+                    )
                 )
-            )
+                if resolved_paths is not None:
+                    resolved_paths[dot_path] = (
+                        actual_value
+                    )
             if not self._condition_evaluator.evaluate(
                 actual_value, condition
             ):
@@ -8,6 +8,9 @@ import yaml
 from apl.server import PolicyServer
 from apl.types import PolicyEvent, Verdict
 
+from .condition_evaluator import (
+    prepare_when_clause,
+)
 from .rule_evaluator import RuleEvaluator
 from .schema import (
     YAMLManifest,
@@ -70,7 +73,9 @@ class YamlPolicyLoader:
         for raw_policy in data.get("policies", []):
             parsed_rules: list[YAMLRule] = [
                 YAMLRule(
-                    when=raw_rule.get("when", {}),
+                    when=prepare_when_clause(
+                        raw_rule.get("when", {})
+                    ),
                     then=raw_rule.get("then", {}),
                 )
                 for raw_rule in raw_policy.get(
@@ -122,10 +127,11 @@ class YamlPolicyLoader:
         async def yaml_policy_handler(
             event: PolicyEvent,
         ) -> Verdict:
+            resolved_paths: dict[str, Any] = {}
             for rule in captured_rules:
                 verdict: Verdict | None = (
                     rule_evaluator.evaluate_rule_against_event(
-                        rule, event
+                        rule, event, resolved_paths
                     )
                 )
                 if verdict is not None:
@@ -13,15 +13,17 @@ def auto_instrument(
     user_id: Optional[str] = None,
     custom_metadata: Optional[dict] = None,
     enabled_providers: Optional[List[str]] = None,
+    quiet: bool = False,
 ) -> InstrumentationState:
-    console.print(
+    report = _silent if quiet else console.print
+    report(
         "\n[bold cyan]🛡️  APL Auto-Instrumentation[/bold cyan]\n"
     )
 
     policy_layer = PolicyLayer()
     for server_uri in policy_servers:
         policy_layer.add_server(server_uri)
-        console.print(
+        report(
             f"  [green]✓[/green] Connected: [cyan]{server_uri}[/cyan]"
         )
 
@@ -30,6 +32,7 @@ def auto_instrument(
         session_id=session_id,
         user_id=user_id,
         custom_metadata=custom_metadata or {},
+        quiet=quiet,
     )
 
     target_providers = enabled_providers or list(
@@ -48,13 +51,11 @@ def auto_instrument(
         provider_instance = provider_class(state)
         provider_instance.patch_all_methods()
         state.register_provider(provider_instance)
-        console.print(
+        report(
             f"  [green]✓[/green] Instrumented: [white]{provider_name}[/white]"
         )
 
-    console.print(
-        "\n[bold green]  ✓ Complete[/bold green]\n"
-    )
+    report("\n[bold green]  ✓ Complete[/bold green]\n")
     return state
 
 
@@ -62,6 +63,11 @@ def uninstrument(state: InstrumentationState) -> None:
     for provider in state.active_providers:
         provider.unpatch_all_methods()
     state.clear_providers()
-    console.print(
-        "[dim]APL instrumentation removed[/dim]"
-    )
+    if not state.quiet:
+        console.print(
+            "[dim]APL instrumentation removed[/dim]"
+        )
+
+
+def _silent(*args, **kwargs) -> None:
+    pass
@@ -3,7 +3,7 @@ from __future__ import annotations
 import asyncio
 import threading
 import uuid
-from dataclasses import dataclass, field
+from dataclasses import dataclass, field, replace
 from typing import TYPE_CHECKING, Any, List, Optional
 
 from apl.layer import PolicyLayer
@@ -19,6 +19,7 @@ class InstrumentationState:
     session_id: Optional[str] = None
     user_id: Optional[str] = None
     custom_metadata: dict = field(default_factory=dict)
+    quiet: bool = False
 
     active_providers: List[BaseProvider] = field(
         default_factory=list
@@ -33,14 +34,25 @@ class InstrumentationState:
     _background_loop_lock: threading.Lock = field(
         default_factory=threading.Lock, repr=False
     )
+    # Long-lived session fields (token_count, token_budget, ...)
+    # that callers may adjust between events.
+    metadata: SessionMetadata = field(
+        init=False, repr=False
+    )
 
     def __post_init__(self):
         if self.session_id is None:
             self.session_id = str(uuid.uuid4())
+        self.metadata = SessionMetadata(
+            session_id=self.session_id,
+            user_id=self.user_id,
+            custom=self.custom_metadata,
+        )
 
     @property
     def session_metadata(self) -> SessionMetadata:
-        return SessionMetadata(
+        return replace(
+            self.metadata,
             session_id=self.session_id,
             user_id=self.user_id,
             custom=self.custom_metadata,
@@ -1,7 +1,10 @@
 from __future__ import annotations
 
 from .base_client_transport import BaseClientTransport
-from .http_client_transport import HttpClientTransport
+from .http_client_transport import (
+    HttpClientTransport,
+    HttpSessionProvider,
+)
 from .stdio_client_transport import (
     StdioClientTransport,
 )
@@ -17,6 +20,9 @@ TRANSPORT_SCHEME_REGISTRY: dict[
 
 def resolve_client_transport_for_uri(
     uri: str,
+    http_session_provider: (
+        HttpSessionProvider | None
+    ) = None,
 ) -> BaseClientTransport:
     scheme: str = uri.split("://")[0]
     transport_class: (
@@ -32,6 +38,15 @@ def resolve_client_transport_for_uri(
             f"Supported schemes: {supported_schemes}"
         )
 
+    if (
+        http_session_provider is not None
+        and issubclass(
+            transport_class, HttpClientTransport
+        )
+    ):
+        return transport_class(
+            uri, session_provider=http_session_provider
+        )
     return transport_class(uri)
 
 
@@ -39,6 +54,7 @@ __all__: list[str] = [
     "BaseClientTransport",
     "StdioClientTransport",
     "HttpClientTransport",
+    "HttpSessionProvider",
     "TRANSPORT_SCHEME_REGISTRY",
     "resolve_client_transport_for_uri",
 ]
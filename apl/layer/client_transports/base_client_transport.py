@@ -23,5 +23,13 @@ class BaseClientTransport(abc.ABC):
         self, serialized_event: dict
     ) -> list[dict]: ...
 
+    async def evaluate_batch(
+        self, serialized_events: list[dict]
+    ) -> list[list[dict]]:
+        return [
+            await self.evaluate(serialized_event)
+            for serialized_event in serialized_events
+        ]
+
     @abc.abstractmethod
     async def close(self) -> None: ...
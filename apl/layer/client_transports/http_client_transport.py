@@ -1,24 +1,60 @@
 from __future__ import annotations
 
+import importlib.util
 import logging
-from typing import Any
+from typing import TYPE_CHECKING, Any, Callable
+
+from apl.serialization import decode_json, encode_json
 
 from .base_client_transport import BaseClientTransport
 
+if TYPE_CHECKING:
+    import aiohttp
+
 logger: logging.Logger = logging.getLogger("apl")
 
-try:
+# aiohttp's client stack is the slowest part of `import apl`, so it
+# is only imported once an HTTP policy server is actually used.
+HAS_AIOHTTP: bool = (
+    importlib.util.find_spec("aiohttp") is not None
+)
+
+JSON_HEADERS: dict[str, str] = {
+    "Content-Type": "application/json"
+}
+
+CONNECTIONS_PER_HOST: int = 16
+KEEPALIVE_TIMEOUT_SECONDS: float = 60.0
+
+HttpSessionProvider = Callable[
+    [], "aiohttp.ClientSession"
+]
+
+
+def create_client_session() -> aiohttp.ClientSession:
     import aiohttp
 
-    HAS_AIOHTTP: bool = True
-except ImportError:
-    HAS_AIOHTTP = False
+    return aiohttp.ClientSession(
+        connector=aiohttp.TCPConnector(
+            limit_per_host=CONNECTIONS_PER_HOST,
+            keepalive_timeout=KEEPALIVE_TIMEOUT_SECONDS,
+        )
+    )
 
 
 class HttpClientTransport(BaseClientTransport):
 
-    def __init__(self, base_url: str) -> None:
+    def __init__(
+        self,
+        base_url: str,
+        session_provider: (
+            HttpSessionProvider | None
+        ) = None,
+    ) -> None:
         self._base_url: str = base_url.rstrip("/")
+        self._session_provider: (
+            HttpSessionProvider | None
+        ) = session_provider
         self._session: aiohttp.ClientSession | None = (
             None
         )
@@ -30,7 +66,11 @@ class HttpClientTransport(BaseClientTransport):
                 "Install it with: pip install aiohttp"
             )
 
-        self._session = aiohttp.ClientSession()
+        self._session = (
+            self._session_provider()
+            if self._session_provider is not None
+            else create_client_session()
+        )
         try:
             manifest_url: str = (
                 f"{self._base_url}/manifest"
@@ -43,12 +83,11 @@ class HttpClientTransport(BaseClientTransport):
                         f"Failed to connect to {self._base_url}: HTTP {response.status}"
                     )
                 manifest_data: dict[str, Any] = (
-                    await response.json()
+                    decode_json(await response.read())
                 )
                 return manifest_data
         except Exception:
-            await self._session.close()
-            self._session = None
+            await self._release_session()
             raise
 
     async def evaluate(
@@ -62,7 +101,9 @@ class HttpClientTransport(BaseClientTransport):
         )
 
         async with self._session.post(
-            evaluate_url, json=serialized_event
+            evaluate_url,
+            data=encode_json(serialized_event),
+            headers=JSON_HEADERS,
         ) as response:
             if response.status != 200:
                 logger.error(
@@ -70,12 +111,64 @@ class HttpClientTransport(BaseClientTransport):
                 )
                 return []
 
-            data: dict[str, Any] = (
-                await response.json()
+            data: dict[str, Any] = decode_json(
+                await response.read()
             )
             return data.get("verdicts", [])
 
+    async def evaluate_batch(
+        self, serialized_events: list[dict]
+    ) -> list[list[dict]]:
+        if self._session is None:
+            return [[] for _ in serialized_events]
+
+        batch_url: str = (
+            f"{self._base_url}/evaluate/batch"
+        )
+
+        async with self._session.post(
+            batch_url,
+            data=encode_json(
+                {"events": serialized_events}
+            ),
+            headers=JSON_HEADERS,
+        ) as response:
+            if response.status != 200:
+                logger.error(
+                    f"Batch policy evaluation failed: HTTP {response.status}"
+                )
+                return [[] for _ in serialized_events]
+
+            data: dict[str, Any] = decode_json(
+                await response.read()
+            )
+            return [
+                self._batch_result_verdicts(result)
+                for result in data.get("results", [])
+            ]
+
+    @staticmethod
+    def _batch_result_verdicts(
+        result: dict[str, Any],
+    ) -> list[dict]:
+        # A per-event failure falls back like a failed single
+        # evaluation; its neighbours keep their verdicts.
+        if "error" in result:
+            logger.error(
+                f"Policy evaluation failed for event {result.get('event_id')}: "
+                f"{result['error']}"
+            )
+            return []
+        return result.get("verdicts", [])
+
     async def close(self) -> None:
-        if self._session is not None:
+        await self._release_session()
+
+    async def _release_session(self) -> None:
+        # Shared sessions belong to whoever provided them.
+        if (
+            self._session is not None
+            and self._session_provider is None
+        ):
             await self._session.close()
-            self._session = None
+        self._session = None
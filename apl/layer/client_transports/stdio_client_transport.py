@@ -1,12 +1,13 @@
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
 import subprocess
 import sys
 from typing import Any
 
+from apl.serialization import decode_json, encode_json
+
 from .base_client_transport import BaseClientTransport
 
 logger: logging.Logger = logging.getLogger("apl")
@@ -19,6 +20,9 @@ class StdioClientTransport(BaseClientTransport):
         self._process: (
             asyncio.subprocess.Process | None
         ) = None
+        self._request_lock: asyncio.Lock = (
+            asyncio.Lock()
+        )
 
     async def connect(self) -> dict | None:
         args: list[str] = self._build_spawn_args()
@@ -39,8 +43,8 @@ class StdioClientTransport(BaseClientTransport):
         if not first_line:
             return None
 
-        message: dict[str, Any] = json.loads(
-            first_line.decode()
+        message: dict[str, Any] = decode_json(
+            first_line
         )
         if message.get("type") == "manifest":
             return message.get("manifest", {})
@@ -62,20 +66,24 @@ class StdioClientTransport(BaseClientTransport):
             "event": serialized_event,
         }
 
-        line: str = json.dumps(wire_message) + "\n"
-        self._process.stdin.write(line.encode())
-        await self._process.stdin.drain()
+        line: bytes = encode_json(wire_message) + b"\n"
 
-        response_line: bytes = (
-            await self._process.stdout.readline()
-        )
+        # One request/response exchange at a time: the pipe has
+        # no request ids, so replies are matched by order alone.
+        async with self._request_lock:
+            self._process.stdin.write(line)
+            await self._process.stdin.drain()
+
+            response_line: bytes = (
+                await self._process.stdout.readline()
+            )
         if not response_line:
             raise ConnectionError(
                 "Policy server subprocess returned no response"
             )
 
-        response: dict[str, Any] = json.loads(
-            response_line.decode()
+        response: dict[str, Any] = decode_json(
+            response_line
         )
         if response.get("type") == "verdicts":
             return response.get("verdicts", [])
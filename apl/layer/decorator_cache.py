@@ -0,0 +1,69 @@
+from __future__ import annotations
+
+import copy
+import json
+import time
+from collections import OrderedDict
+from typing import Any
+
+from apl.types import Verdict
+
+DEFAULT_MAX_ENTRIES: int = 1024
+
+
+class DecoratorVerdictCache:
+    """
+    TTL + LRU cache of composed verdicts for one decorated tool,
+    keyed on the tool name and canonical JSON of its arguments.
+    """
+
+    def __init__(
+        self,
+        ttl_seconds: float,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[
+            str, tuple[float, Verdict]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    @staticmethod
+    def key_for(
+        tool_name: str | None, tool_args: Any
+    ) -> str | None:
+        # Arguments that are not plain JSON have no stable
+        # identity, so those calls are never cached.
+        try:
+            return json.dumps(
+                [tool_name, tool_args],
+                sort_keys=True,
+                separators=(",", ":"),
+            )
+        except (TypeError, ValueError):
+            return None
+
+    def get(self, key: str) -> Verdict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, verdict = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return copy.deepcopy(verdict)
+
+    def put(self, key: str, verdict: Verdict) -> None:
+        self._entries[key] = (
+            time.monotonic() + self._ttl_seconds,
+            copy.deepcopy(verdict),
+        )
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
@@ -14,11 +14,18 @@ from apl.types import (
     Modification,
 )
 
+from .decorator_cache import DecoratorVerdictCache
 from .exceptions import PolicyDenied, PolicyEscalation
 
 if TYPE_CHECKING:
     from .policy_layer import PolicyLayer
 
+# Escalations need a fresh human decision and modifications rewrite
+# the call, so only plain allow/deny verdicts are reused.
+_CACHEABLE_DECISIONS = frozenset(
+    (Decision.ALLOW, Decision.DENY)
+)
+
 
 class PolicyDecoratorFactory:
 
@@ -33,11 +40,25 @@ class PolicyDecoratorFactory:
         messages_from: (
             Callable[[], list] | None
         ) = None,
+        cache_ttl_seconds: float | None = None,
     ) -> Callable:
+        if cache_ttl_seconds and messages_from:
+            raise ValueError(
+                "cache_ttl_seconds cannot be combined with "
+                "messages_from: cached verdicts are keyed on "
+                "tool_name and tool_args only"
+            )
 
         def decorator(
             func: Callable[..., Coroutine],
         ) -> Callable[..., Coroutine]:
+            cache: DecoratorVerdictCache | None = (
+                DecoratorVerdictCache(
+                    cache_ttl_seconds
+                )
+                if cache_ttl_seconds
+                else None
+            )
 
             @wraps(func)
             async def wrapper(
@@ -48,19 +69,33 @@ class PolicyDecoratorFactory:
                         args, kwargs
                     )
                 )
-                messages: list = (
-                    messages_from()
-                    if messages_from
-                    else []
-                )
-
-                verdict = (
-                    await self._policy_layer.evaluate(
+                cache_key: str | None = None
+                verdict = None
+                if cache is not None:
+                    cache_key = cache.key_for(
+                        payload.tool_name,
+                        payload.tool_args,
+                    )
+                if cache_key is not None:
+                    verdict = cache.get(cache_key)
+
+                if verdict is None:
+                    messages: list = (
+                        messages_from()
+                        if messages_from
+                        else []
+                    )
+                    verdict = await self._policy_layer.evaluate(
                         event_type=event_type,
                         messages=messages,
                         payload=payload,
                     )
-                )
+                    if (
+                        cache_key is not None
+                        and verdict.decision
+                        in _CACHEABLE_DECISIONS
+                    ):
+                        cache.put(cache_key, verdict)
 
                 self._enforce_verdict(verdict, kwargs)
                 return await func(*args, **kwargs)
@@ -4,6 +4,9 @@ import logging
 from typing import Any
 
 from apl.serialization import (
+    EVENT_SERIALIZER,
+    MANIFEST_SERIALIZER,
+    VERDICT_SERIALIZER,
     EventSerializer,
     ManifestSerializer,
     VerdictSerializer,
@@ -16,6 +19,7 @@ from apl.types import (
 
 from .client_transports import (
     BaseClientTransport,
+    HttpSessionProvider,
     resolve_client_transport_for_uri,
 )
 
@@ -24,20 +28,29 @@ logger: logging.Logger = logging.getLogger("apl")
 
 class PolicyClient:
 
-    def __init__(self, uri: str) -> None:
+    def __init__(
+        self,
+        uri: str,
+        http_session_provider: (
+            HttpSessionProvider | None
+        ) = None,
+    ) -> None:
         self.uri: str = uri
         self.manifest: PolicyManifest | None = None
         self._transport: BaseClientTransport = (
-            resolve_client_transport_for_uri(uri)
+            resolve_client_transport_for_uri(
+                uri,
+                http_session_provider=http_session_provider,
+            )
         )
         self._event_serializer: EventSerializer = (
-            EventSerializer()
+            EVENT_SERIALIZER
         )
         self._manifest_serializer: (
             ManifestSerializer
-        ) = ManifestSerializer()
+        ) = MANIFEST_SERIALIZER
         self._verdict_serializer: VerdictSerializer = (
-            VerdictSerializer()
+            VERDICT_SERIALIZER
         )
         self._is_connected: bool = False
 
@@ -63,20 +76,55 @@ class PolicyClient:
         self._is_connected = True
 
     async def evaluate(
-        self, event: PolicyEvent
+        self,
+        event: PolicyEvent,
+        serialized_event: dict[str, Any] | None = None,
     ) -> list[Verdict]:
         if not self._is_connected:
             await self.connect()
 
-        serialized_event: dict[str, Any] = (
-            self._event_serializer.serialize(event)
-        )
+        if serialized_event is None:
+            serialized_event = (
+                self._event_serializer.serialize(event)
+            )
         raw_verdicts: list[dict[str, Any]] = (
             await self._transport.evaluate(
                 serialized_event
             )
         )
 
+        return self._deserialize_verdicts(raw_verdicts)
+
+    async def evaluate_batch(
+        self, events: list[PolicyEvent]
+    ) -> list[list[Verdict]]:
+        if not self._is_connected:
+            await self.connect()
+
+        raw_results: list[list[dict[str, Any]]] = (
+            await self._transport.evaluate_batch(
+                [
+                    self._event_serializer.serialize(
+                        event
+                    )
+                    for event in events
+                ]
+            )
+        )
+        if len(raw_results) != len(events):
+            raise ConnectionError(
+                f"Policy server returned {len(raw_results)} results "
+                f"for a batch of {len(events)} events"
+            )
+
+        return [
+            self._deserialize_verdicts(raw_verdicts)
+            for raw_verdicts in raw_results
+        ]
+
+    def _deserialize_verdicts(
+        self, raw_verdicts: list[dict[str, Any]]
+    ) -> list[Verdict]:
         if not raw_verdicts:
             return [
                 Verdict.allow(
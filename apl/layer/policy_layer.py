@@ -6,8 +6,11 @@ import time
 from typing import Any, Callable
 
 from apl.composition import VerdictComposer
+from apl.serialization import EVENT_SERIALIZER
 from apl.types import (
     CompositionConfig,
+    CompositionMode,
+    Decision,
     EventPayload,
     EventType,
     Message,
@@ -15,6 +18,9 @@ from apl.types import (
     Verdict,
 )
 
+from .client_transports.http_client_transport import (
+    create_client_session,
+)
 from .decorator_evaluator import PolicyDecoratorFactory
 from .event_builder import PolicyEventBuilder
 from .policy_client import PolicyClient
@@ -27,6 +33,7 @@ class PolicyLayer:
     def __init__(
         self,
         composition: CompositionConfig | None = None,
+        http_session: Any = None,
     ) -> None:
         self._composition: CompositionConfig = (
             composition or CompositionConfig()
@@ -42,9 +49,21 @@ class PolicyLayer:
         self._decorator_factory: (
             PolicyDecoratorFactory
         ) = PolicyDecoratorFactory(self)
+        self._background_evaluations: set[
+            asyncio.Task
+        ] = set()
+        # A caller-supplied aiohttp.ClientSession is used as is
+        # and left open on close(); otherwise the layer owns one.
+        self._http_session: Any = http_session
+        self._owns_http_session: bool = (
+            http_session is None
+        )
 
     def add_server(self, uri: str) -> PolicyLayer:
-        client: PolicyClient = PolicyClient(uri)
+        client: PolicyClient = PolicyClient(
+            uri,
+            http_session_provider=self._shared_http_session,
+        )
         self._clients.append(client)
         return self
 
@@ -74,14 +93,39 @@ class PolicyLayer:
         )
 
     async def close(self) -> None:
+        # Let evaluations left running after an early deny
+        # finish before their clients and session go away.
+        if self._background_evaluations:
+            await asyncio.gather(
+                *self._background_evaluations,
+                return_exceptions=True,
+            )
         await asyncio.gather(
             *[
                 client.close()
                 for client in self._clients
             ]
         )
+        if (
+            self._owns_http_session
+            and self._http_session is not None
+        ):
+            await self._http_session.close()
+            self._http_session = None
         self._is_connected = False
 
+    def _shared_http_session(self) -> Any:
+        # One connection pool for every HTTP policy server on
+        # this layer, created on first connect inside the loop.
+        if self._owns_http_session and (
+            self._http_session is None
+            or self._http_session.closed
+        ):
+            self._http_session = (
+                create_client_session()
+            )
+        return self._http_session
+
     async def evaluate(
         self,
         event_type: EventType | str,
@@ -99,13 +143,13 @@ class PolicyLayer:
             metadata=metadata,
         )
 
-        start_time: float = time.perf_counter()
+        start_ns: int = time.perf_counter_ns()
         verdicts: list[Verdict] = (
             await self._collect_verdicts(event)
         )
         elapsed_ms: float = (
-            time.perf_counter() - start_time
-        ) * 1000
+            time.perf_counter_ns() - start_ns
+        ) / 1_000_000
 
         logger.debug(
             f"Evaluated {len(verdicts)} policies in {elapsed_ms:.1f}ms"
@@ -119,10 +163,12 @@ class PolicyLayer:
         messages_from: (
             Callable[[], list] | None
         ) = None,
+        cache_ttl_seconds: float | None = None,
     ) -> Callable:
         return self._decorator_factory.create_event_decorator(
             event_type=event_type,
             messages_from=messages_from,
+            cache_ttl_seconds=cache_ttl_seconds,
         )
 
     def wrap(self, agent: Any) -> Any:
@@ -147,23 +193,39 @@ class PolicyLayer:
     async def _collect_verdicts(
         self, event: Any
     ) -> list[Verdict]:
+        # Serialize once here rather than once per server.
+        serialized_event: dict[str, Any] = (
+            EVENT_SERIALIZER.serialize(event)
+        )
         if self._composition.parallel:
             return (
                 await self._collect_verdicts_parallel(
-                    event
+                    event, serialized_event
                 )
             )
         return await self._collect_verdicts_sequential(
-            event
+            event, serialized_event
         )
 
     async def _collect_verdicts_parallel(
-        self, event: Any
+        self,
+        event: Any,
+        serialized_event: dict[str, Any],
     ) -> list[Verdict]:
+        if (
+            self._composition.mode
+            == CompositionMode.DENY_OVERRIDES
+        ):
+            return await self._collect_verdicts_until_deny(
+                event, serialized_event
+            )
+
         nested_verdict_lists: list[list[Verdict]] = (
             await asyncio.gather(
                 *[
-                    client.evaluate(event)
+                    client.evaluate(
+                        event, serialized_event
+                    )
                     for client in self._clients
                 ]
             )
@@ -174,13 +236,78 @@ class PolicyLayer:
             for verdict in verdict_list
         ]
 
+    async def _collect_verdicts_until_deny(
+        self,
+        event: Any,
+        serialized_event: dict[str, Any],
+    ) -> list[Verdict]:
+        tasks: list[asyncio.Task] = [
+            asyncio.ensure_future(
+                client.evaluate(
+                    event, serialized_event
+                )
+            )
+            for client in self._clients
+        ]
+        pending: set[asyncio.Task] = set(tasks)
+        # Tasks before this index finished without denying.
+        settled: int = 0
+
+        try:
+            while pending:
+                _, pending = await asyncio.wait(
+                    pending,
+                    return_when=asyncio.FIRST_COMPLETED,
+                )
+                # Walk finished servers in order so the reported
+                # deny is always the lowest-index one, as a full
+                # deny-overrides pass would pick.
+                while (
+                    settled < len(tasks)
+                    and tasks[settled].done()
+                ):
+                    for verdict in tasks[
+                        settled
+                    ].result():
+                        if (
+                            verdict.decision
+                            == Decision.DENY
+                        ):
+                            return [verdict]
+                    settled += 1
+        finally:
+            for task in pending:
+                self._background_evaluations.add(task)
+                task.add_done_callback(
+                    self._finish_background_evaluation
+                )
+
+        return [
+            verdict
+            for task in tasks
+            for verdict in task.result()
+        ]
+
+    def _finish_background_evaluation(
+        self, task: asyncio.Task
+    ) -> None:
+        self._background_evaluations.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.warning(
+                f"Background policy evaluation failed: {task.exception()}"
+            )
+
     async def _collect_verdicts_sequential(
-        self, event: Any
+        self,
+        event: Any,
+        serialized_event: dict[str, Any],
     ) -> list[Verdict]:
         all_verdicts: list[Verdict] = []
         for client in self._clients:
             client_verdicts: list[Verdict] = (
-                await client.evaluate(event)
+                await client.evaluate(
+                    event, serialized_event
+                )
             )
             all_verdicts.extend(client_verdicts)
         return all_verdicts
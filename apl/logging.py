@@ -16,7 +16,10 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import logging
+import logging.handlers
+import queue
 import sys
 from typing import Optional
 
@@ -66,11 +69,38 @@ APL_THEME = Theme(
 )
 
 
+DECISION_MARKUP = {
+    Decision.ALLOW: "[policy.allow]ALLOW[/policy.allow]",
+    Decision.DENY: "[policy.deny]DENY[/policy.deny]",
+    Decision.MODIFY: "[policy.modify]MODIFY[/policy.modify]",
+    Decision.ESCALATE: "[policy.escalate]ESCALATE[/policy.escalate]",
+    Decision.OBSERVE: "[policy.observe]OBSERVE[/policy.observe]",
+}
+
+
 # =============================================================================
 # CUSTOM LOG HANDLER
 # =============================================================================
 
 
+class _PlainFormatter(logging.Formatter):
+    """Formatter that strips Rich markup from messages."""
+
+    def formatMessage(
+        self, record: logging.LogRecord
+    ) -> str:
+        if getattr(record, "markup", False):
+            record = logging.makeLogRecord(
+                {
+                    **record.__dict__,
+                    "message": Text.from_markup(
+                        record.message
+                    ).plain,
+                }
+            )
+        return super().formatMessage(record)
+
+
 class APLRichHandler(RichHandler):
     """
     Custom Rich handler with APL-specific formatting.
@@ -216,15 +246,7 @@ class APLLogger:
         elapsed_ms: Optional[float] = None,
     ):
         """Log policy evaluation result."""
-        decision_styles = {
-            Decision.ALLOW: "[policy.allow]ALLOW[/policy.allow]",
-            Decision.DENY: "[policy.deny]DENY[/policy.deny]",
-            Decision.MODIFY: "[policy.modify]MODIFY[/policy.modify]",
-            Decision.ESCALATE: "[policy.escalate]ESCALATE[/policy.escalate]",
-            Decision.OBSERVE: "[policy.observe]OBSERVE[/policy.observe]",
-        }
-
-        decision_str = decision_styles.get(
+        decision_str = DECISION_MARKUP.get(
             verdict.decision, str(verdict.decision)
         )
         timing_str = (
@@ -254,15 +276,7 @@ class APLLogger:
         elapsed_ms: float,
     ):
         """Log verdict composition result."""
-        decision_styles = {
-            Decision.ALLOW: "[policy.allow]ALLOW[/policy.allow]",
-            Decision.DENY: "[policy.deny]DENY[/policy.deny]",
-            Decision.MODIFY: "[policy.modify]MODIFY[/policy.modify]",
-            Decision.ESCALATE: "[policy.escalate]ESCALATE[/policy.escalate]",
-            Decision.OBSERVE: "[policy.observe]OBSERVE[/policy.observe]",
-        }
-
-        decision_str = decision_styles.get(
+        decision_str = DECISION_MARKUP.get(
             final_decision, str(final_decision)
         )
 
@@ -311,6 +325,41 @@ class APLLogger:
         )
 
 
+# =============================================================================
+# BACKGROUND LOGGING
+# =============================================================================
+
+
+class _InProcessQueueHandler(
+    logging.handlers.QueueHandler
+):
+    """Queue handler that hands records over untouched.
+
+    The listener runs in the same process, so records keep their
+    exc_info and markup flags for the rich handler to render.
+    """
+
+    def prepare(
+        self, record: logging.LogRecord
+    ) -> logging.LogRecord:
+        return record
+
+
+_queue_listener: Optional[
+    logging.handlers.QueueListener
+] = None
+
+
+def _stop_queue_listener() -> None:
+    global _queue_listener
+    if _queue_listener is not None:
+        _queue_listener.stop()
+        _queue_listener = None
+
+
+atexit.register(_stop_queue_listener)
+
+
 # =============================================================================
 # SETUP FUNCTION
 # =============================================================================
@@ -318,16 +367,20 @@ class APLLogger:
 
 def setup_logging(
     level: str = "INFO",
-    rich_output: bool = True,
+    rich_output: Optional[bool] = None,
     log_file: Optional[str] = None,
+    background: bool = False,
 ) -> APLLogger:
     """
     Configure APL logging.
 
     Args:
         level: Log level (DEBUG, INFO, WARNING, ERROR)
-        rich_output: Enable rich console output (disable for stdio transport)
+        rich_output: Enable rich console output (disable for stdio transport).
+            None (the default) enables it only when stderr is a terminal.
         log_file: Optional file path for log output
+        background: Format and write records on a background thread
+            so request handlers never block on console or file I/O
 
     Returns:
         APLLogger instance
@@ -341,8 +394,12 @@ def setup_logging(
     root_logger.setLevel(
         getattr(logging, level.upper())
     )
+    _stop_queue_listener()
     root_logger.handlers.clear()
 
+    if rich_output is None:
+        rich_output = sys.stderr.isatty()
+
     if rich_output:
         # Rich console handler
         console = Console(theme=APL_THEME, stderr=True)
@@ -356,10 +413,11 @@ def setup_logging(
         )
         root_logger.addHandler(handler)
     else:
-        # Simple stream handler for stdio transport
+        # Simple stream handler for stdio transport and
+        # non-interactive runs (CI, redirected output)
         handler = logging.StreamHandler(sys.stderr)
         handler.setFormatter(
-            logging.Formatter(
+            _PlainFormatter(
                 "%(asctime)s [%(levelname)s] %(name)s: %(message)s",
                 datefmt="%Y-%m-%d %H:%M:%S",
             )
@@ -377,6 +435,25 @@ def setup_logging(
         )
         root_logger.addHandler(file_handler)
 
+    if background:
+        global _queue_listener
+        handlers = list(root_logger.handlers)
+        log_queue: queue.SimpleQueue = (
+            queue.SimpleQueue()
+        )
+        root_logger.handlers.clear()
+        root_logger.addHandler(
+            _InProcessQueueHandler(log_queue)
+        )
+        _queue_listener = (
+            logging.handlers.QueueListener(
+                log_queue,
+                *handlers,
+                respect_handler_level=True,
+            )
+        )
+        _queue_listener.start()
+
     return APLLogger("main", level)
 
 
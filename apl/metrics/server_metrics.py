@@ -1,3 +1,4 @@
+import time
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 
@@ -14,11 +15,15 @@ class ServerMetrics:
     latency_sum_ms: float = 0.0
     latency_count: int = 0
     errors_total: int = 0
+    version: int = 0
     start_time: datetime = field(
         default_factory=lambda: datetime.now(
             timezone.utc
         )
     )
+    _start_monotonic: float = field(
+        default_factory=time.monotonic, repr=False
+    )
 
     def record_request(
         self,
@@ -39,9 +44,11 @@ class ServerMetrics:
         )
         self.latency_sum_ms += latency_ms
         self.latency_count += 1
+        self.version += 1
 
     def record_error(self) -> None:
         self.errors_total += 1
+        self.version += 1
 
     @property
     def average_latency_ms(self) -> float:
@@ -51,7 +58,4 @@ class ServerMetrics:
 
     @property
     def uptime_seconds(self) -> float:
-        return (
-            datetime.now(timezone.utc)
-            - self.start_time
-        ).total_seconds()
+        return time.monotonic() - self._start_monotonic
@@ -1,15 +1,25 @@
 from .event_serializer import EventSerializer
+from .json_codec import decode_json, encode_json
 from .manifest_serializer import ManifestSerializer
 from .message_serializer import MessageSerializer
 from .metadata_serializer import MetadataSerializer
 from .payload_serializer import PayloadSerializer
 from .verdict_serializer import VerdictSerializer
 
+EVENT_SERIALIZER = EventSerializer()
+MANIFEST_SERIALIZER = ManifestSerializer()
+VERDICT_SERIALIZER = VerdictSerializer()
+
 __all__ = [
+    "EVENT_SERIALIZER",
+    "MANIFEST_SERIALIZER",
+    "VERDICT_SERIALIZER",
     "EventSerializer",
     "ManifestSerializer",
     "MessageSerializer",
     "MetadataSerializer",
     "PayloadSerializer",
     "VerdictSerializer",
+    "decode_json",
+    "encode_json",
 ]
@@ -0,0 +1,42 @@
+from __future__ import annotations
+
+import json
+from datetime import datetime
+from enum import Enum
+from typing import Any
+
+try:
+    import orjson
+
+    HAS_ORJSON: bool = True
+except ImportError:
+    HAS_ORJSON = False
+
+
+def _encode_fallback(value: Any) -> Any:
+    if isinstance(value, Enum):
+        return value.value
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(
+        f"Object of type {type(value).__name__} "
+        "is not JSON serializable"
+    )
+
+
+def encode_json(data: Any) -> bytes:
+    if HAS_ORJSON:
+        return orjson.dumps(
+            data,
+            default=_encode_fallback,
+            option=orjson.OPT_NON_STR_KEYS,
+        )
+    return json.dumps(
+        data, default=_encode_fallback
+    ).encode()
+
+
+def decode_json(raw: bytes | str) -> Any:
+    if HAS_ORJSON:
+        return orjson.loads(raw)
+    return json.loads(raw)
@@ -7,6 +7,10 @@ from apl.types import (
     Verdict,
 )
 
+_DECISION_BY_VALUE: dict[str, Decision] = {
+    decision.value: decision for decision in Decision
+}
+
 
 class VerdictSerializer:
 
@@ -63,7 +67,9 @@ class VerdictSerializer:
             )
 
         return Verdict(
-            decision=Decision(data["decision"]),
+            decision=self._deserialize_decision(
+                data["decision"]
+            ),
             confidence=data.get("confidence", 1.0),
             reasoning=data.get("reasoning"),
             modifications=modifications,
@@ -74,6 +80,13 @@ class VerdictSerializer:
             trace=data.get("trace"),
         )
 
+    @staticmethod
+    def _deserialize_decision(value: str) -> Decision:
+        decision = _DECISION_BY_VALUE.get(value)
+        if decision is None:
+            return Decision(value)
+        return decision
+
     def _serialize_modification(
         self, modification: Modification
     ) -> dict[str, Any]:
@@ -9,6 +9,7 @@ from .registered_policy import (
     PolicyHandler,
     RegisteredPolicy,
 )
+from .verdict_cache import VerdictCache
 
 __all__ = [
     "PolicyServer",
@@ -18,4 +19,5 @@ __all__ = [
     "create_policy_decorator",
     "invoke_policy_handler",
     "generate_manifest_from_server",
+    "VerdictCache",
 ]
@@ -16,7 +16,17 @@ async def invoke_policy_handler(
     policy: RegisteredPolicy,
     event: PolicyEvent,
 ) -> Verdict:
-    start_time: float = time.perf_counter()
+    start_ns: int = time.perf_counter_ns()
+
+    cache = policy.verdict_cache
+    if cache is not None:
+        cache_key = cache.key_for(event)
+        cached = cache.get(cache_key)
+        if cached is not None:
+            cached.evaluation_ms = (
+                _calculate_elapsed_ms(start_ns)
+            )
+            return cached
 
     try:
         result: Any = policy.handler(event)
@@ -30,14 +40,19 @@ async def invoke_policy_handler(
             )
 
         elapsed_ms: float = _calculate_elapsed_ms(
-            start_time
+            start_ns
         )
-        return _enrich_verdict_with_policy_metadata(
+        verdict = _enrich_verdict_with_policy_metadata(
             result, policy, elapsed_ms
         )
+        if cache is not None and isinstance(
+            result, Verdict
+        ):
+            cache.put(cache_key, verdict)
+        return verdict
 
     except asyncio.TimeoutError:
-        elapsed_ms = _calculate_elapsed_ms(start_time)
+        elapsed_ms = _calculate_elapsed_ms(start_ns)
         logger.warning(
             f"Policy {policy.name} timed out after {elapsed_ms:.1f}ms"
         )
@@ -46,7 +61,7 @@ async def invoke_policy_handler(
         )
 
     except Exception as exc:
-        elapsed_ms = _calculate_elapsed_ms(start_time)
+        elapsed_ms = _calculate_elapsed_ms(start_ns)
         logger.error(
             f"Policy {policy.name} raised exception: {exc}"
         )
@@ -55,8 +70,10 @@ async def invoke_policy_handler(
         )
 
 
-def _calculate_elapsed_ms(start_time: float) -> float:
-    return (time.perf_counter() - start_time) * 1000
+def _calculate_elapsed_ms(start_ns: int) -> float:
+    return (
+        time.perf_counter_ns() - start_ns
+    ) / 1_000_000
 
 
 def _enrich_verdict_with_policy_metadata(
@@ -14,6 +14,7 @@ from .registered_policy import (
     PolicyHandler,
     RegisteredPolicy,
 )
+from .verdict_cache import VerdictCache
 
 if TYPE_CHECKING:
     from .policy_registry import PolicyRegistry
@@ -28,6 +29,7 @@ def create_policy_decorator(
     blocking: bool = True,
     timeout_ms: int = 1000,
     description: str | None = None,
+    cache_ttl_seconds: float | None = None,
 ) -> Callable[[PolicyHandler], PolicyHandler]:
     event_types: list[EventType] = _parse_event_types(
         events
@@ -35,6 +37,13 @@ def create_policy_decorator(
     context_requirements: list[ContextRequirement] = (
         _parse_context_requirements(context)
     )
+    if cache_ttl_seconds is not None and not (
+        context_requirements
+    ):
+        raise ValueError(
+            f"Policy '{policy_name}' sets cache_ttl_seconds "
+            "but declares no context paths to key the cache on"
+        )
 
     def decorator(
         handler: PolicyHandler,
@@ -49,6 +58,17 @@ def create_policy_decorator(
                 blocking=blocking,
                 timeout_ms=timeout_ms,
                 description=description,
+                verdict_cache=(
+                    VerdictCache(
+                        [
+                            requirement.path
+                            for requirement in context_requirements
+                        ],
+                        ttl_seconds=cache_ttl_seconds,
+                    )
+                    if cache_ttl_seconds is not None
+                    else None
+                ),
             )
         )
 
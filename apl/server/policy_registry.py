@@ -1,6 +1,8 @@
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import asyncio
+from dataclasses import replace
+from typing import TYPE_CHECKING, Callable
 
 from apl.logging import get_logger
 from apl.types import (
@@ -29,6 +31,11 @@ class PolicyRegistry:
         self._handlers_by_event: dict[
             EventType, list[RegisteredPolicy]
         ] = {}
+        self._version: int = 0
+
+    @property
+    def version(self) -> int:
+        return self._version
 
     def register(
         self, policy: RegisteredPolicy
@@ -47,9 +54,11 @@ class PolicyRegistry:
                 policy
             )
 
+        self._version += 1
+
         logger.info(
             f"Registered policy: {policy.name} for events: "
-            f"{[e.value for e in policy.events]}"
+            f"{list(policy.event_values)}"
         )
 
     def get_policy_by_name(
@@ -73,7 +82,44 @@ class PolicyRegistry:
         handlers = self.get_handlers_for_event_type(
             event.type
         )
+        return await self._evaluate_with_handlers(
+            event, handlers
+        )
 
+    async def evaluate_batch(
+        self, events: list[PolicyEvent]
+    ) -> list[list[Verdict] | BaseException]:
+        # One failing event must not fail its neighbours, so
+        # exceptions are returned in place, as in gather().
+        handlers_by_type: dict[
+            EventType, list[RegisteredPolicy]
+        ] = {}
+        for event in events:
+            if event.type not in handlers_by_type:
+                handlers_by_type[event.type] = (
+                    self.get_handlers_for_event_type(
+                        event.type
+                    )
+                )
+
+        return list(
+            await asyncio.gather(
+                *(
+                    self._evaluate_with_handlers(
+                        event,
+                        handlers_by_type[event.type],
+                    )
+                    for event in events
+                ),
+                return_exceptions=True,
+            )
+        )
+
+    async def _evaluate_with_handlers(
+        self,
+        event: PolicyEvent,
+        handlers: list[RegisteredPolicy],
+    ) -> list[Verdict]:
         if not handlers:
             return [
                 Verdict.allow(
@@ -107,59 +153,44 @@ class PolicyRegistry:
         event: PolicyEvent,
         modification: Modification,
     ) -> PolicyEvent:
-        payload = event.payload
-        new_payload_kwargs = {
-            "tool_name": payload.tool_name,
-            "tool_args": payload.tool_args,
-            "tool_result": payload.tool_result,
-            "tool_error": payload.tool_error,
-            "llm_model": payload.llm_model,
-            "llm_prompt": payload.llm_prompt,
-            "llm_response": payload.llm_response,
-            "llm_tokens_used": payload.llm_tokens_used,
-            "output_text": payload.output_text,
-            "output_structured": payload.output_structured,
-            "plan": payload.plan,
-            "target_agent": payload.target_agent,
-            "source_agent": payload.source_agent,
-            "handoff_payload": payload.handoff_payload,
-        }
-
         target = modification.target
-        value = modification.value
-
-        if target == "output":
-            if payload.tool_result is not None:
-                new_payload_kwargs["tool_result"] = (
-                    value
-                )
-            elif payload.output_text is not None:
-                new_payload_kwargs["output_text"] = (
-                    value
-                )
-            else:
-                new_payload_kwargs["output_text"] = (
-                    value
-                )
-        elif target == "input":
+        if target == "input":
             logger.warning(
                 f"Modification target 'input' is not supported during sequential evaluation; "
                 f"use instrumentation-level events for input modifications"
             )
-        elif target == "tool_args":
-            new_payload_kwargs["tool_args"] = value
-        elif target == "llm_prompt":
-            new_payload_kwargs["llm_prompt"] = value
+            return event
 
-        new_payload = EventPayload(
-            **new_payload_kwargs
+        resolve_field = _PAYLOAD_FIELD_BY_TARGET.get(
+            target
         )
+        if resolve_field is None:
+            return event
 
-        return PolicyEvent(
-            id=event.id,
-            type=event.type,
-            timestamp=event.timestamp,
-            messages=event.messages,
-            payload=new_payload,
-            metadata=event.metadata,
+        payload = event.payload
+        new_payload = replace(
+            payload,
+            **{
+                resolve_field(
+                    payload
+                ): modification.value
+            },
         )
+        return replace(event, payload=new_payload)
+
+
+def _output_payload_field(
+    payload: EventPayload,
+) -> str:
+    if payload.tool_result is not None:
+        return "tool_result"
+    return "output_text"
+
+
+_PAYLOAD_FIELD_BY_TARGET: dict[
+    str, Callable[[EventPayload], str]
+] = {
+    "output": _output_payload_field,
+    "tool_args": lambda payload: "tool_args",
+    "llm_prompt": lambda payload: "llm_prompt",
+}
@@ -30,11 +30,18 @@ class PolicyServer:
         self._registry: PolicyRegistry = (
             PolicyRegistry()
         )
+        self._manifest_cache: (
+            tuple[tuple, PolicyManifest] | None
+        ) = None
 
     @property
     def registry(self) -> PolicyRegistry:
         return self._registry
 
+    @property
+    def manifest_version(self) -> int:
+        return self._registry.version
+
     def policy(
         self,
         name: str,
@@ -44,6 +51,7 @@ class PolicyServer:
         blocking: bool = True,
         timeout_ms: int = 1000,
         description: str | None = None,
+        cache_ttl_seconds: float | None = None,
     ) -> Callable[[PolicyHandler], PolicyHandler]:
         return create_policy_decorator(
             registry=self._registry,
@@ -54,6 +62,7 @@ class PolicyServer:
             blocking=blocking,
             timeout_ms=timeout_ms,
             description=description,
+            cache_ttl_seconds=cache_ttl_seconds,
         )
 
     async def evaluate(
@@ -63,8 +72,29 @@ class PolicyServer:
             event
         )
 
+    async def evaluate_batch(
+        self, events: list[PolicyEvent]
+    ) -> list[list[Verdict] | BaseException]:
+        return await self._registry.evaluate_batch(
+            events
+        )
+
     def get_manifest(self) -> PolicyManifest:
-        return generate_manifest_from_server(self)
+        cache_key = (
+            self._registry.version,
+            self.name,
+            self.version,
+            self.description,
+        )
+        if (
+            self._manifest_cache is None
+            or self._manifest_cache[0] != cache_key
+        ):
+            self._manifest_cache = (
+                cache_key,
+                generate_manifest_from_server(self),
+            )
+        return self._manifest_cache[1]
 
     def run(
         self, transport: str = "stdio", **kwargs
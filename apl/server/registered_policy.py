@@ -1,7 +1,12 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Awaitable, Callable, Union
+from dataclasses import dataclass, field
+from typing import (
+    TYPE_CHECKING,
+    Awaitable,
+    Callable,
+    Union,
+)
 
 from apl.types import (
     ContextRequirement,
@@ -10,6 +15,9 @@ from apl.types import (
     Verdict,
 )
 
+if TYPE_CHECKING:
+    from .verdict_cache import VerdictCache
+
 PolicyHandler = Callable[
     [PolicyEvent], Union[Verdict, Awaitable[Verdict]]
 ]
@@ -25,3 +33,13 @@ class RegisteredPolicy:
     blocking: bool
     timeout_ms: int
     description: str | None = None
+    verdict_cache: VerdictCache | None = None
+    event_values: tuple[str, ...] = field(
+        init=False, repr=False
+    )
+
+    def __post_init__(self) -> None:
+        self.event_values = tuple(
+            event_type.value
+            for event_type in self.events
+        )
@@ -0,0 +1,90 @@
+from __future__ import annotations
+
+import time
+from collections import OrderedDict
+from dataclasses import replace
+from typing import Any, Hashable
+
+from apl.types import PolicyEvent, Verdict
+
+DEFAULT_MAX_ENTRIES: int = 1024
+
+
+class VerdictCache:
+    """
+    TTL + LRU cache of one policy's verdicts.
+
+    Entries are keyed on the event type and the values at the
+    policy's declared context paths, so a policy must only read
+    what it declares for caching to be safe.
+    """
+
+    def __init__(
+        self,
+        context_paths: list[str],
+        ttl_seconds: float,
+        max_entries: int = DEFAULT_MAX_ENTRIES,
+    ) -> None:
+        self._path_parts: tuple[
+            tuple[str, ...], ...
+        ] = tuple(
+            tuple(path.split("."))
+            for path in context_paths
+        )
+        self._ttl_seconds = ttl_seconds
+        self._max_entries = max_entries
+        self._entries: OrderedDict[
+            Hashable, tuple[float, Verdict]
+        ] = OrderedDict()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def key_for(self, event: PolicyEvent) -> Hashable:
+        return (
+            event.type,
+            tuple(
+                repr(_resolve(event, parts))
+                for parts in self._path_parts
+            ),
+        )
+
+    def get(self, key: Hashable) -> Verdict | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        expires_at, verdict = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return replace(verdict)
+
+    def put(
+        self, key: Hashable, verdict: Verdict
+    ) -> None:
+        self._entries[key] = (
+            time.monotonic() + self._ttl_seconds,
+            replace(verdict),
+        )
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+
+def _resolve(obj: Any, parts: tuple[str, ...]) -> Any:
+    for part in parts:
+        if obj is None:
+            return None
+        if hasattr(obj, part):
+            obj = getattr(obj, part)
+        elif isinstance(obj, dict):
+            obj = obj.get(part)
+        else:
+            return None
+    return obj
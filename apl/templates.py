@@ -152,15 +152,18 @@ server = PolicyServer(
     description="PII detection and redaction policy"
 )
 
-# PII Patterns
+# PII Patterns, compiled once at import
 PATTERNS = {{
-    "ssn": (r'\\b\\d{{3}}-\\d{{2}}-\\d{{4}}\\b', '[SSN REDACTED]'),
-    "credit_card": (r'\\b\\d{{4}}[-\\s]?\\d{{4}}[-\\s]?\\d{{4}}[-\\s]?\\d{{4}}\\b', '[CC REDACTED]'),
-    "email": (r'\\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Z|a-z]{{2,}}\\b', '[EMAIL REDACTED]'),
-    "phone": (r'\\b\\d{{3}}[-.]?\\d{{3}}[-.]?\\d{{4}}\\b', '[PHONE REDACTED]'),
-    "ip_address": (r'\\b\\d{{1,3}}\\.\\d{{1,3}}\\.\\d{{1,3}}\\.\\d{{1,3}}\\b', '[IP REDACTED]'),
+    "ssn": (re.compile(r'\\b\\d{{3}}-\\d{{2}}-\\d{{4}}\\b'), '[SSN REDACTED]'),
+    "credit_card": (re.compile(r'\\b\\d{{4}}[-\\s]?\\d{{4}}[-\\s]?\\d{{4}}[-\\s]?\\d{{4}}\\b'), '[CC REDACTED]'),
+    "email": (re.compile(r'\\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\\.[A-Z|a-z]{{2,}}\\b'), '[EMAIL REDACTED]'),
+    "phone": (re.compile(r'\\b\\d{{3}}[-.]?\\d{{3}}[-.]?\\d{{4}}\\b'), '[PHONE REDACTED]'),
+    "ip_address": (re.compile(r'\\b\\d{{1,3}}\\.\\d{{1,3}}\\.\\d{{1,3}}\\.\\d{{1,3}}\\b'), '[IP REDACTED]'),
 }}
 
+# Every pattern needs a digit or an "@"; text without either is clean
+PII_TRIGGER = re.compile(r'[\\d@]')
+
 
 @server.policy(
     name="redact-pii-output",
@@ -171,17 +174,16 @@ PATTERNS = {{
 async def redact_pii_output(event: PolicyEvent) -> Verdict:
     """Scan output for PII and redact if found."""
     text = event.payload.output_text
-    if not text:
+    if not text or not PII_TRIGGER.search(text):
         return Verdict.allow()
     
     found = []
     redacted = text
     
     for name, (pattern, replacement) in PATTERNS.items():
-        matches = re.findall(pattern, redacted)
-        if matches:
-            found.append(f"{{name}}: {{len(matches)}}")
-            redacted = re.sub(pattern, replacement, redacted)
+        redacted, count = pattern.subn(replacement, redacted)
+        if count:
+            found.append(f"{{name}}: {{count}}")
     
     if found:
         return Verdict.modify(
@@ -204,9 +206,11 @@ async def redact_pii_output(event: PolicyEvent) -> Verdict:
 async def block_pii_tools(event: PolicyEvent) -> Verdict:
     """Block tool calls that would send PII externally."""
     args_str = str(event.payload.tool_args or {{}})
+    if not PII_TRIGGER.search(args_str):
+        return Verdict.allow()
     
     for name, (pattern, _) in PATTERNS.items():
-        if re.search(pattern, args_str):
+        if pattern.search(args_str):
             return Verdict.deny(
                 reasoning=f"Tool arguments contain {{name}} - refusing to send externally",
                 confidence=0.9
@@ -356,14 +360,12 @@ server = PolicyServer(
     description="Human confirmation for destructive operations"
 )
 
-DESTRUCTIVE_PATTERNS = [
-    r".*delete.*",
-    r".*remove.*",
-    r".*drop.*",
-    r".*destroy.*",
-    r".*purge.*",
-    r"rm\\b",
-]
+# One case-insensitive alternation: a single scan per tool name,
+# with no lowercased copy of the name
+DESTRUCTIVE_PATTERN = re.compile(
+    r"delete|remove|drop|destroy|purge|^rm\\b",
+    re.IGNORECASE,
+)
 
 
 @server.policy(
@@ -377,17 +379,16 @@ async def confirm_destructive(event: PolicyEvent) -> Verdict:
     tool_name = event.payload.tool_name or ""
     tool_args = event.payload.tool_args or {{}}
     
-    for pattern in DESTRUCTIVE_PATTERNS:
-        if re.match(pattern, tool_name.lower()):
-            target = tool_args.get("target") or tool_args.get("path") or str(tool_args)
-            
-            return Verdict.escalate(
-                type="human_confirm",
-                prompt=f"⚠️ Destructive action: {{tool_name}}\\n\\nTarget: {{target}}\\n\\nProceed?",
-                options=["Proceed", "Cancel"],
-                reasoning=f"Tool '{{tool_name}}' matches destructive pattern",
-                timeout_ms=60000
-            )
+    if DESTRUCTIVE_PATTERN.search(tool_name):
+        target = tool_args.get("target") or tool_args.get("path") or str(tool_args)
+        
+        return Verdict.escalate(
+            type="human_confirm",
+            prompt=f"⚠️ Destructive action: {{tool_name}}\\n\\nTarget: {{target}}\\n\\nProceed?",
+            options=["Proceed", "Cancel"],
+            reasoning=f"Tool '{{tool_name}}' matches destructive pattern",
+            timeout_ms=60000
+        )
     
     return Verdict.allow()
 
@@ -5,8 +5,12 @@ from aiohttp import web
 from apl.logging import APLLogger
 from apl.metrics import ServerMetrics
 
+from .batch_dispatcher import BatchDispatcher
 from .middleware import MIDDLEWARE_STACK
 from .routes import register_all_routes
+from .routes.manifest_route import ManifestBodyCache
+from .routes.metrics_route import MetricsBodyCache
+from .routes.sse_route import SSEBroadcaster
 
 if TYPE_CHECKING:
     from apl.server import PolicyServer
@@ -20,6 +24,16 @@ def create_http_application(
 
     app["server"] = server
     app["metrics"] = ServerMetrics()
+    app["metrics_cache"] = MetricsBodyCache()
+    app["manifest_cache"] = ManifestBodyCache()
+
+    app["batch_dispatcher"] = BatchDispatcher(server)
+    app.on_startup.append(_start_batch_dispatcher)
+    app.on_cleanup.append(_stop_batch_dispatcher)
+
+    app["sse_broadcaster"] = SSEBroadcaster()
+    app.on_startup.append(_start_sse_broadcaster)
+    app.on_cleanup.append(_stop_sse_broadcaster)
 
     if logger:
         app["logger"] = logger
@@ -27,3 +41,27 @@ def create_http_application(
     register_all_routes(app)
 
     return app
+
+
+async def _start_batch_dispatcher(
+    app: web.Application,
+) -> None:
+    await app["batch_dispatcher"].start()
+
+
+async def _stop_batch_dispatcher(
+    app: web.Application,
+) -> None:
+    await app["batch_dispatcher"].stop()
+
+
+async def _start_sse_broadcaster(
+    app: web.Application,
+) -> None:
+    await app["sse_broadcaster"].start()
+
+
+async def _stop_sse_broadcaster(
+    app: web.Application,
+) -> None:
+    await app["sse_broadcaster"].stop()
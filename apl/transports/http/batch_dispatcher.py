@@ -0,0 +1,168 @@
+from __future__ import annotations
+
+import asyncio
+from typing import TYPE_CHECKING
+
+from apl.logging import get_logger
+from apl.types import PolicyEvent, Verdict
+
+if TYPE_CHECKING:
+    from apl.server import PolicyServer
+
+logger = get_logger("transport.http.batch")
+
+MAX_BATCH_SIZE: int = 64
+MAX_WAIT_MS: float = 1.0
+
+
+class BatchDispatcher:
+    def __init__(
+        self,
+        server: "PolicyServer",
+        max_batch_size: int = MAX_BATCH_SIZE,
+        max_wait_ms: float = MAX_WAIT_MS,
+    ) -> None:
+        self._server = server
+        self._max_batch_size = max_batch_size
+        self._max_wait_seconds = max_wait_ms / 1000
+        self._queue: (
+            asyncio.Queue[
+                tuple[PolicyEvent, asyncio.Future]
+            ]
+            | None
+        ) = None
+        self._worker: asyncio.Task | None = None
+        self._batch: list[
+            tuple[PolicyEvent, asyncio.Future]
+        ] = []
+        self._in_flight: set[asyncio.Task] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._worker is not None
+
+    async def start(self) -> None:
+        if self._worker is not None:
+            return
+        self._queue = asyncio.Queue()
+        self._worker = asyncio.create_task(
+            self._drain_forever()
+        )
+
+    async def stop(self) -> None:
+        if self._worker is None:
+            return
+
+        self._worker.cancel()
+        try:
+            await self._worker
+        except asyncio.CancelledError:
+            pass
+        self._worker = None
+
+        # Events the worker dequeued but never dispatched.
+        stranded, self._batch = self._batch, []
+        for _, future in stranded:
+            if not future.done():
+                future.set_exception(
+                    RuntimeError(
+                        "Batch dispatcher stopped"
+                    )
+                )
+
+        if self._in_flight:
+            await asyncio.gather(
+                *self._in_flight,
+                return_exceptions=True,
+            )
+
+        while not self._queue.empty():
+            _, future = self._queue.get_nowait()
+            if not future.done():
+                future.set_exception(
+                    RuntimeError(
+                        "Batch dispatcher stopped"
+                    )
+                )
+
+    async def submit(
+        self, event: PolicyEvent
+    ) -> list[Verdict]:
+        if self._worker is None:
+            return await self._server.evaluate(event)
+
+        future = (
+            asyncio.get_running_loop().create_future()
+        )
+        self._queue.put_nowait((event, future))
+        return await future
+
+    async def _drain_forever(self) -> None:
+        while True:
+            batch = self._batch = [
+                await self._queue.get()
+            ]
+            self._collect_ready(batch)
+
+            # Only linger for stragglers under concurrent load;
+            # a lone request is dispatched straight away.
+            if (
+                1 < len(batch) < self._max_batch_size
+                and self._max_wait_seconds > 0
+            ):
+                await asyncio.sleep(
+                    self._max_wait_seconds
+                )
+                self._collect_ready(batch)
+
+            self._batch = []
+            task = asyncio.create_task(
+                self._dispatch(batch)
+            )
+            self._in_flight.add(task)
+            task.add_done_callback(
+                self._in_flight.discard
+            )
+
+    def _collect_ready(
+        self,
+        batch: list[
+            tuple[PolicyEvent, asyncio.Future]
+        ],
+    ) -> None:
+        while len(batch) < self._max_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except asyncio.QueueEmpty:
+                return
+
+    async def _dispatch(
+        self,
+        batch: list[
+            tuple[PolicyEvent, asyncio.Future]
+        ],
+    ) -> None:
+        events = [event for event, _ in batch]
+
+        try:
+            results = (
+                await self._server.evaluate_batch(
+                    events
+                )
+            )
+        except Exception as exc:
+            logger.error(
+                f"Batch evaluation of {len(events)} events failed: {exc}"
+            )
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results):
+            if future.done():
+                continue
+            if isinstance(result, BaseException):
+                future.set_exception(result)
+            else:
+                future.set_result(result)
@@ -9,7 +9,10 @@ from apl.logging import (
     setup_logging,
 )
 from apl.transports.base_transport import BaseTransport
-from apl.utilities import kill_process_on_port
+from apl.utilities import (
+    kill_process_on_port,
+    run_event_loop,
+)
 
 from .app_factory import create_http_application
 
@@ -26,20 +29,26 @@ class HTTPTransport(BaseTransport):
         host: str = "0.0.0.0",
         port: int = 8080,
         apl_logger: APLLogger | None = None,
+        reuse_port: bool = False,
+        backlog: int = 4096,
     ):
         super().__init__(server)
         self._host = host
         self._port = port
         self._logger = apl_logger
+        self._reuse_port = reuse_port
+        self._backlog = backlog
         self._runner: web.AppRunner | None = None
         self._site: web.TCPSite | None = None
 
     def run(self) -> None:
-        asyncio.run(self._run_until_stopped())
+        run_event_loop(self._run_until_stopped())
 
     async def start(self) -> None:
         if self._logger is None:
-            self._logger = setup_logging()
+            self._logger = setup_logging(
+                background=True
+            )
 
         app = create_http_application(
             self.server, self._logger
@@ -48,9 +57,7 @@ class HTTPTransport(BaseTransport):
         self._runner = web.AppRunner(app)
         await self._runner.setup()
 
-        self._site = web.TCPSite(
-            self._runner, self._host, self._port
-        )
+        self._site = self._create_site()
 
         try:
             await self._site.start()
@@ -64,6 +71,15 @@ class HTTPTransport(BaseTransport):
             "http", f"{self._host}:{self._port}"
         )
 
+    def _create_site(self) -> web.TCPSite:
+        return web.TCPSite(
+            self._runner,
+            self._host,
+            self._port,
+            backlog=self._backlog,
+            reuse_port=self._reuse_port,
+        )
+
     async def stop(self) -> None:
         if self._runner:
             await self._runner.cleanup()
@@ -87,9 +103,7 @@ class HTTPTransport(BaseTransport):
 
         if kill_process_on_port(self._port):
             await asyncio.sleep(0.5)
-            self._site = web.TCPSite(
-                self._runner, self._host, self._port
-            )
+            self._site = self._create_site()
             try:
                 await self._site.start()
             except OSError:
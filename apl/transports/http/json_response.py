@@ -0,0 +1,15 @@
+from typing import Any
+
+from aiohttp import web
+
+from apl.serialization import encode_json
+
+
+def json_response(
+    data: Any, status: int = 200
+) -> web.Response:
+    return web.Response(
+        body=encode_json(data),
+        status=status,
+        content_type="application/json",
+    )
@@ -1,27 +1,24 @@
 from aiohttp import web
 from aiohttp.web import middleware
 
+CORS_HEADERS: dict[str, str] = {
+    "Access-Control-Allow-Origin": "*",
+    "Access-Control-Allow-Methods": "GET, POST, OPTIONS",
+    "Access-Control-Allow-Headers": "Content-Type, Authorization, X-Request-ID",
+    "Access-Control-Max-Age": "86400",
+}
+
 
 @middleware
 async def cors_middleware(
     request: web.Request, handler
 ):
     if request.method == "OPTIONS":
-        response = web.Response()
-    else:
-        response = await handler(request)
+        return web.Response(
+            status=204, headers=CORS_HEADERS
+        )
 
-    response.headers["Access-Control-Allow-Origin"] = (
-        "*"
-    )
-    response.headers[
-        "Access-Control-Allow-Methods"
-    ] = "GET, POST, OPTIONS"
-    response.headers[
-        "Access-Control-Allow-Headers"
-    ] = "Content-Type, Authorization, X-Request-ID"
-    response.headers["Access-Control-Max-Age"] = (
-        "86400"
-    )
+    response = await handler(request)
+    response.headers.update(CORS_HEADERS)
 
     return response
@@ -3,6 +3,27 @@ import json
 from aiohttp import web
 from aiohttp.web import middleware
 
+from apl.serialization import encode_json
+
+from ..json_response import json_response
+
+_INVALID_JSON_BODY_PREFIX = (
+    encode_json({"error": "Invalid JSON"})[:-1]
+    + b',"detail":'
+)
+
+
+def _invalid_json_response(
+    error: json.JSONDecodeError,
+) -> web.Response:
+    return web.Response(
+        body=_INVALID_JSON_BODY_PREFIX
+        + encode_json(str(error))
+        + b"}",
+        status=400,
+        content_type="application/json",
+    )
+
 
 @middleware
 async def error_middleware(
@@ -13,13 +34,7 @@ async def error_middleware(
     except web.HTTPException:
         raise
     except json.JSONDecodeError as e:
-        return web.json_response(
-            {
-                "error": "Invalid JSON",
-                "detail": str(e),
-            },
-            status=400,
-        )
+        return _invalid_json_response(e)
     except Exception as e:
         if "metrics" in request.app:
             request.app["metrics"].record_error()
@@ -27,7 +42,7 @@ async def error_middleware(
             request.app["logger"].error(
                 f"Unhandled error: {e}", exc_info=True
             )
-        return web.json_response(
+        return json_response(
             {
                 "error": "Internal server error",
                 "detail": str(e),
@@ -1,15 +1,24 @@
-import uuid
+import itertools
+import secrets
 
 from aiohttp import web
 from aiohttp.web import middleware
 
+_REQUEST_ID_PREFIX = secrets.token_hex(6)
+_request_counter = itertools.count(1)
+
+
+def _next_request_id() -> str:
+    return f"{_REQUEST_ID_PREFIX}-{next(_request_counter):x}"
+
 
 @middleware
 async def request_id_middleware(
     request: web.Request, handler
 ):
-    request_id = request.headers.get(
-        "X-Request-ID", str(uuid.uuid4())
+    request_id = (
+        request.headers.get("X-Request-ID")
+        or _next_request_id()
     )
     request["request_id"] = request_id
 
@@ -3,6 +3,7 @@ from aiohttp import web
 from .evaluate_route import (
     EvaluateRouteHandler,
     handle_evaluate,
+    handle_evaluate_batch,
 )
 from .health_route import handle_health
 from .manifest_route import handle_manifest
@@ -10,23 +11,31 @@ from .metrics_route import handle_metrics
 from .sse_route import handle_server_sent_events
 
 
+async def _redirect_to_health(
+    request: web.Request,
+) -> web.Response:
+    raise web.HTTPFound("/health")
+
+
 def register_all_routes(app: web.Application) -> None:
     app.router.add_post("/evaluate", handle_evaluate)
+    app.router.add_post(
+        "/evaluate/batch", handle_evaluate_batch
+    )
     app.router.add_get("/manifest", handle_manifest)
     app.router.add_get("/health", handle_health)
     app.router.add_get("/metrics", handle_metrics)
     app.router.add_get(
         "/events", handle_server_sent_events
     )
-    app.router.add_get(
-        "/", lambda r: web.HTTPFound("/health")
-    )
+    app.router.add_get("/", _redirect_to_health)
 
 
 __all__ = [
     "register_all_routes",
     "EvaluateRouteHandler",
     "handle_evaluate",
+    "handle_evaluate_batch",
     "handle_manifest",
     "handle_health",
     "handle_metrics",
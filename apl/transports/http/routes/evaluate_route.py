@@ -1,18 +1,29 @@
 import time
+from typing import AsyncIterator
 
 from aiohttp import web
 
 from apl.composition import VerdictComposer
 from apl.serialization import (
-    EventSerializer,
-    VerdictSerializer,
+    EVENT_SERIALIZER,
+    VERDICT_SERIALIZER,
+    decode_json,
+    encode_json,
 )
+from apl.types import Verdict
+
+from ..json_response import json_response
+
+_TYPE_FIELD_MARKER = b'"type"'
+
+STREAMING_VERDICT_THRESHOLD = 32
+VERDICTS_PER_CHUNK = 16
 
 
 class EvaluateRouteHandler:
     def __init__(self):
-        self._event_serializer = EventSerializer()
-        self._verdict_serializer = VerdictSerializer()
+        self._event_serializer = EVENT_SERIALIZER
+        self._verdict_serializer = VERDICT_SERIALIZER
         self._composer = VerdictComposer()
 
     async def handle(
@@ -21,18 +32,21 @@ class EvaluateRouteHandler:
         server = request.app["server"]
         metrics = request.app.get("metrics")
         logger = request.app.get("logger")
+        dispatcher = request.app.get(
+            "batch_dispatcher"
+        )
+
+        start_ns = time.perf_counter_ns()
+
+        raw = await request.read()
 
-        start = time.perf_counter()
+        if _TYPE_FIELD_MARKER not in raw:
+            return self._missing_type_response()
 
-        data = await request.json()
+        data = decode_json(raw)
 
         if "type" not in data:
-            return web.json_response(
-                {
-                    "error": "Missing required field: type"
-                },
-                status=400,
-            )
+            return self._missing_type_response()
 
         event = self._event_serializer.deserialize(
             data
@@ -43,10 +57,13 @@ class EvaluateRouteHandler:
                 event.type.value, event.id
             )
 
-        verdicts = await server.evaluate(event)
+        if dispatcher is not None:
+            verdicts = await dispatcher.submit(event)
+        else:
+            verdicts = await server.evaluate(event)
         elapsed_ms = (
-            time.perf_counter() - start
-        ) * 1000
+            time.perf_counter_ns() - start_ns
+        ) / 1_000_000
 
         if logger:
             for v in verdicts:
@@ -72,7 +89,18 @@ class EvaluateRouteHandler:
                 elapsed_ms,
             )
 
-        return web.json_response(
+        if len(verdicts) > STREAMING_VERDICT_THRESHOLD:
+            return web.Response(
+                body=self._iter_response_chunks(
+                    event.id,
+                    verdicts,
+                    composed,
+                    elapsed_ms,
+                ),
+                content_type="application/json",
+            )
+
+        return json_response(
             {
                 "event_id": event.id,
                 "verdicts": [
@@ -88,6 +116,134 @@ class EvaluateRouteHandler:
             }
         )
 
+    async def _iter_response_chunks(
+        self,
+        event_id: str,
+        verdicts: list[Verdict],
+        composed: Verdict,
+        elapsed_ms: float,
+    ) -> AsyncIterator[bytes]:
+        serialize = self._verdict_serializer.serialize
+
+        yield (
+            b'{"event_id":'
+            + encode_json(event_id)
+            + b',"verdicts":['
+        )
+
+        for offset in range(
+            0, len(verdicts), VERDICTS_PER_CHUNK
+        ):
+            chunk = b",".join(
+                encode_json(serialize(v))
+                for v in verdicts[
+                    offset : offset
+                    + VERDICTS_PER_CHUNK
+                ]
+            )
+            yield (
+                chunk if offset == 0 else b"," + chunk
+            )
+
+        yield (
+            b'],"composed_verdict":'
+            + encode_json(serialize(composed))
+            + b',"evaluation_ms":'
+            + encode_json(elapsed_ms)
+            + b"}"
+        )
+
+    async def handle_batch(
+        self, request: web.Request
+    ) -> web.Response:
+        server = request.app["server"]
+        metrics = request.app.get("metrics")
+
+        start_ns = time.perf_counter_ns()
+
+        data = decode_json(await request.read())
+        raw_events = (
+            data.get("events")
+            if isinstance(data, dict)
+            else None
+        )
+
+        if not isinstance(raw_events, list):
+            return json_response(
+                {
+                    "error": "Missing required field: events"
+                },
+                status=400,
+            )
+        if not all(
+            isinstance(raw, dict) and "type" in raw
+            for raw in raw_events
+        ):
+            return self._missing_type_response()
+
+        events = [
+            self._event_serializer.deserialize(raw)
+            for raw in raw_events
+        ]
+        results = await server.evaluate_batch(events)
+        elapsed_ms = (
+            time.perf_counter_ns() - start_ns
+        ) / 1_000_000
+
+        # Events are evaluated together, so each is charged an
+        # equal share of the batch's wall time.
+        per_event_ms = elapsed_ms / max(len(events), 1)
+
+        serialize = self._verdict_serializer.serialize
+        body = []
+        for event, verdicts in zip(events, results):
+            # A failed event is reported on its own entry so
+            # the rest of the batch still gets its verdicts.
+            if isinstance(verdicts, BaseException):
+                if metrics:
+                    metrics.record_error()
+                body.append(
+                    {
+                        "event_id": event.id,
+                        "error": str(verdicts),
+                    }
+                )
+                continue
+
+            composed = self._composer.compose(verdicts)
+            if metrics:
+                metrics.record_request(
+                    event.type.value,
+                    composed.decision.value,
+                    per_event_ms,
+                )
+            body.append(
+                {
+                    "event_id": event.id,
+                    "verdicts": [
+                        serialize(v) for v in verdicts
+                    ],
+                    "composed_verdict": serialize(
+                        composed
+                    ),
+                }
+            )
+
+        return json_response(
+            {
+                "results": body,
+                "evaluation_ms": elapsed_ms,
+            }
+        )
+
+    @staticmethod
+    def _missing_type_response() -> web.Response:
+        return json_response(
+            {"error": "Missing required field: type"},
+            status=400,
+        )
+
 
 _handler = EvaluateRouteHandler()
 handle_evaluate = _handler.handle
+handle_evaluate_batch = _handler.handle_batch
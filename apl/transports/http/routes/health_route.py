@@ -1,5 +1,7 @@
 from aiohttp import web
 
+from ..json_response import json_response
+
 
 async def handle_health(
     request: web.Request,
@@ -24,4 +26,4 @@ async def handle_health(
             metrics.requests_total
         )
 
-    return web.json_response(response)
+    return json_response(response)
@@ -1,13 +1,22 @@
+import hashlib
+from dataclasses import dataclass
+
 from aiohttp import web
 
+from apl.serialization import encode_json
 
-async def handle_manifest(
-    request: web.Request,
-) -> web.Response:
-    server = request.app["server"]
+
+@dataclass
+class ManifestBodyCache:
+    version: int = -1
+    body: bytes = b""
+    etag: str = ""
+
+
+def _build_manifest_body(server) -> bytes:
     manifest = server.get_manifest()
 
-    return web.json_response(
+    return encode_json(
         {
             "server_name": manifest.server_name,
             "server_version": manifest.server_version,
@@ -28,3 +37,46 @@ async def handle_manifest(
             ],
         }
     )
+
+
+def _refresh_cache(
+    cache: ManifestBodyCache, server
+) -> ManifestBodyCache:
+    version = server.manifest_version
+    if cache.version != version:
+        body = _build_manifest_body(server)
+        cache.body = body
+        cache.etag = (
+            '"'
+            + hashlib.sha1(body).hexdigest()[:16]
+            + '"'
+        )
+        cache.version = version
+    return cache
+
+
+async def handle_manifest(
+    request: web.Request,
+) -> web.Response:
+    server = request.app["server"]
+    cache = request.app.get("manifest_cache")
+
+    if cache is None:
+        cache = ManifestBodyCache()
+    _refresh_cache(cache, server)
+
+    headers = {"ETag": cache.etag}
+
+    if (
+        request.headers.get("If-None-Match")
+        == cache.etag
+    ):
+        return web.Response(
+            status=304, headers=headers
+        )
+
+    return web.Response(
+        body=cache.body,
+        content_type="application/json",
+        headers=headers,
+    )
@@ -1,7 +1,40 @@
+import time
+from dataclasses import dataclass
+
 from aiohttp import web
 
 from apl.metrics import export_metrics_to_prometheus
 
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4"
+METRICS_BODY_TTL_SECONDS = 0.25
+
+
+@dataclass
+class MetricsBodyCache:
+    version: int = -1
+    rendered_at: float = 0.0
+    body: str = ""
+
+
+def _render_metrics_body(
+    metrics, cache: MetricsBodyCache | None
+) -> str:
+    if cache is None:
+        return export_metrics_to_prometheus(metrics)
+
+    now = time.monotonic()
+    if (
+        cache.version == metrics.version
+        and now - cache.rendered_at
+        < METRICS_BODY_TTL_SECONDS
+    ):
+        return cache.body
+
+    cache.body = export_metrics_to_prometheus(metrics)
+    cache.version = metrics.version
+    cache.rendered_at = now
+    return cache.body
+
 
 async def handle_metrics(
     request: web.Request,
@@ -11,10 +44,12 @@ async def handle_metrics(
     if metrics is None:
         return web.Response(
             text="# No metrics available\n",
-            content_type="text/plain; version=0.0.4",
+            content_type=PROMETHEUS_CONTENT_TYPE,
         )
 
     return web.Response(
-        text=export_metrics_to_prometheus(metrics),
-        content_type="text/plain; version=0.0.4",
+        text=_render_metrics_body(
+            metrics, request.app.get("metrics_cache")
+        ),
+        content_type=PROMETHEUS_CONTENT_TYPE,
     )
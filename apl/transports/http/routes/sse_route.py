@@ -2,6 +2,79 @@ import asyncio
 
 from aiohttp import web
 
+KEEPALIVE_FRAME = b": keepalive\n\n"
+KEEPALIVE_INTERVAL_SECONDS = 15.0
+
+
+class SSEBroadcaster:
+    def __init__(
+        self,
+        interval_seconds: float = KEEPALIVE_INTERVAL_SECONDS,
+    ) -> None:
+        self._interval_seconds = interval_seconds
+        self._clients: dict[
+            web.StreamResponse, asyncio.Event
+        ] = {}
+        self._ticker: asyncio.Task | None = None
+
+    @property
+    def client_count(self) -> int:
+        return len(self._clients)
+
+    async def start(self) -> None:
+        if self._ticker is None:
+            self._ticker = asyncio.create_task(
+                self._tick_forever()
+            )
+
+    async def stop(self) -> None:
+        if self._ticker is not None:
+            self._ticker.cancel()
+            try:
+                await self._ticker
+            except asyncio.CancelledError:
+                pass
+            self._ticker = None
+
+        for closed in self._clients.values():
+            closed.set()
+        self._clients.clear()
+
+    def subscribe(
+        self, response: web.StreamResponse
+    ) -> asyncio.Event:
+        closed = asyncio.Event()
+        self._clients[response] = closed
+        return closed
+
+    def unsubscribe(
+        self, response: web.StreamResponse
+    ) -> None:
+        closed = self._clients.pop(response, None)
+        if closed is not None:
+            closed.set()
+
+    async def broadcast(self, frame: bytes) -> None:
+        clients = list(self._clients)
+        if not clients:
+            return
+
+        results = await asyncio.gather(
+            *(
+                client.write(frame)
+                for client in clients
+            ),
+            return_exceptions=True,
+        )
+        for client, result in zip(clients, results):
+            if isinstance(result, Exception):
+                self.unsubscribe(client)
+
+    async def _tick_forever(self) -> None:
+        while True:
+            await asyncio.sleep(self._interval_seconds)
+            await self.broadcast(KEEPALIVE_FRAME)
+
 
 async def handle_server_sent_events(
     request: web.Request,
@@ -14,12 +87,24 @@ async def handle_server_sent_events(
     response.headers["Connection"] = "keep-alive"
 
     await response.prepare(request)
+    await response.write(KEEPALIVE_FRAME)
+
+    broadcaster = request.app.get("sse_broadcaster")
 
     try:
-        while True:
-            await response.write(b": keepalive\n\n")
-            await asyncio.sleep(15)
+        if broadcaster is None:
+            while True:
+                await asyncio.sleep(
+                    KEEPALIVE_INTERVAL_SECONDS
+                )
+                await response.write(KEEPALIVE_FRAME)
+        else:
+            closed = broadcaster.subscribe(response)
+            await closed.wait()
     except asyncio.CancelledError:
         pass
+    finally:
+        if broadcaster is not None:
+            broadcaster.unsubscribe(response)
 
     return response
@@ -1,8 +1,9 @@
 import asyncio
-import json
 import sys
 from typing import AsyncIterator
 
+from apl.serialization import decode_json
+
 
 async def create_stdin_reader() -> (
     asyncio.StreamReader
@@ -22,4 +23,4 @@ async def read_json_lines(
         line = await reader.readline()
         if not line:
             break
-        yield json.loads(line.decode())
+        yield decode_json(line)
@@ -1,9 +1,16 @@
-import json
 import sys
 from typing import Any
 
+from apl.serialization import encode_json
+
 
 def write_json_line(message: dict[str, Any]) -> None:
-    line = json.dumps(message) + "\n"
-    sys.stdout.write(line)
-    sys.stdout.flush()
+    line = encode_json(message) + b"\n"
+    buffer = getattr(sys.stdout, "buffer", None)
+    if buffer is not None:
+        sys.stdout.flush()
+        buffer.write(line)
+        buffer.flush()
+    else:
+        sys.stdout.write(line.decode())
+        sys.stdout.flush()
@@ -3,9 +3,9 @@ from typing import TYPE_CHECKING
 
 from apl.logging import get_logger
 from apl.serialization import (
-    EventSerializer,
-    ManifestSerializer,
-    VerdictSerializer,
+    EVENT_SERIALIZER,
+    MANIFEST_SERIALIZER,
+    VERDICT_SERIALIZER,
 )
 
 from .message_writer import write_json_line
@@ -19,11 +19,9 @@ logger = get_logger("transport.stdio")
 class StdioProtocolHandler:
     def __init__(self, server: "PolicyServer"):
         self._server = server
-        self._event_serializer = EventSerializer()
-        self._verdict_serializer = VerdictSerializer()
-        self._manifest_serializer = (
-            ManifestSerializer()
-        )
+        self._event_serializer = EVENT_SERIALIZER
+        self._verdict_serializer = VERDICT_SERIALIZER
+        self._manifest_serializer = MANIFEST_SERIALIZER
 
     async def handle_message(
         self, message: dict
@@ -1,9 +1,9 @@
-import asyncio
 import json
 from typing import TYPE_CHECKING
 
 from apl.logging import get_logger
 from apl.transports.base_transport import BaseTransport
+from apl.utilities import run_event_loop
 
 from .message_reader import (
     create_stdin_reader,
@@ -26,7 +26,7 @@ class StdioTransport(BaseTransport):
         )
 
     def run(self) -> None:
-        asyncio.run(self._run_message_loop())
+        run_event_loop(self._run_message_loop())
 
     async def start(self) -> None:
         self._running = True
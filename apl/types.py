@@ -13,6 +13,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from functools import cached_property
 from typing import Any, Literal, Optional
 
 # =============================================================================
@@ -208,6 +209,14 @@ class PolicyEvent:
     # Session metadata
     metadata: SessionMetadata
 
+    @cached_property
+    def latest_user_message(self) -> Optional[Message]:
+        """Most recent user message, computed once per event."""
+        for message in reversed(self.messages):
+            if message.role == "user":
+                return message
+        return None
+
 
 # =============================================================================
 # VERDICTS - What policies return
@@ -232,7 +241,7 @@ class Decision(str, Enum):
     OBSERVE = "observe"
 
 
-@dataclass
+@dataclass(slots=True)
 class Modification:
     """How to modify the action/content."""
 
@@ -254,7 +263,7 @@ class Modification:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Escalation:
     """How to escalate to humans."""
 
@@ -280,7 +289,7 @@ class Escalation:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class Verdict:
     """Policy response."""
 
@@ -380,7 +389,7 @@ class Verdict:
 # =============================================================================
 
 
-@dataclass
+@dataclass(slots=True)
 class ContextRequirement:
     """
     A single context field requirement.
@@ -398,7 +407,7 @@ class ContextRequirement:
     )
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyDefinition:
     """
     How a policy server describes its policies to the runtime.
@@ -428,7 +437,7 @@ class PolicyDefinition:
     tags: list[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class PolicyManifest:
     """
     Complete manifest from a policy server.
@@ -475,7 +484,7 @@ class CompositionMode(str, Enum):
     WEIGHTED = "weighted"  # Confidence-weighted voting
 
 
-@dataclass
+@dataclass(slots=True)
 class CompositionConfig:
     """Configuration for verdict composition."""
 
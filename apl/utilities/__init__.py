@@ -1,5 +1,12 @@
-from .port_manager import kill_process_on_port
+from .event_loop import HAS_UVLOOP, run_event_loop
+from .port_manager import (
+    kill_process_on_port,
+    kill_processes_on_ports,
+)
 
 __all__ = [
+    "HAS_UVLOOP",
     "kill_process_on_port",
+    "kill_processes_on_ports",
+    "run_event_loop",
 ]
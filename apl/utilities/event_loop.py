@@ -0,0 +1,17 @@
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+try:
+    import uvloop
+
+    HAS_UVLOOP: bool = True
+except ImportError:
+    HAS_UVLOOP = False
+
+T = TypeVar("T")
+
+
+def run_event_loop(main: Coroutine[Any, Any, T]) -> T:
+    if HAS_UVLOOP:
+        return uvloop.run(main)
+    return asyncio.run(main)
@@ -2,74 +2,209 @@ import os
 import signal
 import subprocess
 import sys
+import time
+from typing import Iterable
+
+TERMINATE_GRACE_SECONDS = 0.05
+
+_PROC_NET_TCP_TABLES = (
+    "/proc/net/tcp",
+    "/proc/net/tcp6",
+)
 
 
 def kill_process_on_port(port: int) -> bool:
+    return kill_processes_on_ports([port])
+
+
+def kill_processes_on_ports(
+    ports: Iterable[int],
+) -> bool:
+    ports = list(dict.fromkeys(ports))
+    if not ports:
+        return False
+
     try:
-        if (
-            sys.platform == "darwin"
-            or sys.platform.startswith("linux")
-        ):
-            return _kill_port_unix(port)
+        if sys.platform.startswith("linux"):
+            return _kill_ports_linux(ports)
+        elif sys.platform == "darwin":
+            return _kill_ports_unix(ports)
         elif sys.platform == "win32":
-            return _kill_port_windows(port)
+            return _kill_ports_windows(ports)
     except Exception:
         pass
     return False
 
 
-def _kill_port_unix(port: int) -> bool:
+def _kill_ports_linux(ports: list[int]) -> bool:
+    inodes = _socket_inodes_for_local_ports(ports)
+    if inodes is None:
+        return _kill_ports_unix(ports)
+    if not inodes:
+        return False
+    return _kill_pids(
+        _pids_owning_socket_inodes(inodes)
+    )
+
+
+def _socket_inodes_for_local_ports(
+    ports: list[int],
+) -> set[str] | None:
+    wanted_ports = {f"{port:04X}" for port in ports}
+    inodes: set[str] = set()
+    readable = False
+
+    for table in _PROC_NET_TCP_TABLES:
+        try:
+            with open(table) as handle:
+                readable = True
+                next(handle, None)
+                for line in handle:
+                    fields = line.split()
+                    if len(fields) < 10:
+                        continue
+                    local_port = fields[1].rpartition(
+                        ":"
+                    )[2]
+                    if (
+                        local_port in wanted_ports
+                        and fields[9] != "0"
+                    ):
+                        inodes.add(fields[9])
+        except OSError:
+            continue
+
+    return inodes if readable else None
+
+
+def _pids_owning_socket_inodes(
+    inodes: set[str],
+) -> list[int]:
+    targets = {f"socket:[{inode}]" for inode in inodes}
+    own_pid = os.getpid()
+    pids: list[int] = []
+
+    with os.scandir("/proc") as processes:
+        for process in processes:
+            if not process.name.isdigit():
+                continue
+            pid = int(process.name)
+            if pid == own_pid:
+                continue
+            try:
+                with os.scandir(
+                    f"/proc/{pid}/fd"
+                ) as descriptors:
+                    for descriptor in descriptors:
+                        try:
+                            link = os.readlink(
+                                descriptor.path
+                            )
+                        except OSError:
+                            continue
+                        if link in targets:
+                            pids.append(pid)
+                            break
+            except OSError:
+                continue
+
+    return pids
+
+
+def _kill_ports_unix(ports: list[int]) -> bool:
     result = subprocess.run(
-        ["lsof", "-ti", f":{port}"],
+        [
+            "lsof",
+            "-t",
+            *(f"-i:{port}" for port in ports),
+        ],
         capture_output=True,
         text=True,
     )
 
-    if not result.stdout.strip():
-        return False
+    pids: list[int] = []
+    for pid in result.stdout.split():
+        try:
+            pids.append(int(pid))
+        except ValueError:
+            pass
+
+    return _kill_pids(pids)
 
-    pids = result.stdout.strip().split("\n")
-    killed = False
+
+def _kill_pids(pids: list[int]) -> bool:
+    signalled: list[int] = []
 
     for pid in pids:
         try:
-            os.kill(int(pid), signal.SIGKILL)
-            killed = True
-        except (ProcessLookupError, ValueError):
+            os.kill(pid, signal.SIGTERM)
+            signalled.append(pid)
+        except ProcessLookupError:
             pass
 
-    return killed
+    if not signalled:
+        return False
+
+    time.sleep(TERMINATE_GRACE_SECONDS)
+
+    for pid in signalled:
+        _reap_if_child(pid)
+        try:
+            os.kill(pid, 0)
+        except ProcessLookupError:
+            continue
+        try:
+            os.kill(pid, signal.SIGKILL)
+        except ProcessLookupError:
+            pass
+        _reap_if_child(pid)
 
+    return True
 
-def _kill_port_windows(port: int) -> bool:
+
+def _reap_if_child(pid: int) -> None:
+    try:
+        os.waitpid(pid, os.WNOHANG)
+    except ChildProcessError:
+        pass
+
+
+def _kill_ports_windows(ports: list[int]) -> bool:
     result = subprocess.run(
-        f"netstat -ano | findstr :{port}",
+        ["netstat", "-ano"],
         capture_output=True,
         text=True,
-        shell=True,
     )
 
-    if not result.stdout.strip():
+    wanted_ports = {str(port) for port in ports}
+    pids: set[int] = set()
+    for line in result.stdout.splitlines():
+        parts = line.split()
+        if len(parts) < 5 or parts[0] != "TCP":
+            continue
+        local_port = parts[1].rpartition(":")[2]
+        if local_port not in wanted_ports:
+            continue
+        try:
+            pid = int(parts[-1])
+        except ValueError:
+            continue
+        if pid:
+            pids.add(pid)
+
+    if not pids:
         return False
 
-    killed = False
-    for line in result.stdout.strip().split("\n"):
-        if f":{port}" in line:
-            parts = line.split()
-            if parts:
-                try:
-                    pid = int(parts[-1])
-                    subprocess.run(
-                        [
-                            "taskkill",
-                            "/F",
-                            "/PID",
-                            str(pid),
-                        ],
-                        capture_output=True,
-                    )
-                    killed = True
-                except (ValueError, IndexError):
-                    pass
-
-    return killed
+    subprocess.run(
+        [
+            "taskkill",
+            "/F",
+            *(
+                arg
+                for pid in sorted(pids)
+                for arg in ("/PID", str(pid))
+            ),
+        ],
+        capture_output=True,
+    )
+    return True
@@ -32,6 +32,13 @@ DEFAULT_TOKEN_BUDGET = 100_000
 DEFAULT_COST_BUDGET_USD = 1.00
 WARNING_THRESHOLD = 0.8  # Warn at 80%
 
+# Expensive models (rough heuristic, lowercase substrings)
+EXPENSIVE_MODELS = (
+    "gpt-4",
+    "claude-3-opus",
+    "claude-opus",
+)
+
 
 @server.policy(
     name="token-budget",
@@ -154,16 +161,9 @@ async def expensive_model_guard(
         else 0
     )
 
-    # Expensive models (rough heuristic)
-    expensive_models = [
-        "gpt-4",
-        "claude-3-opus",
-        "claude-opus",
-    ]
-
+    model_lower = model.lower()
     is_expensive = any(
-        exp in model.lower()
-        for exp in expensive_models
+        exp in model_lower for exp in EXPENSIVE_MODELS
     )
 
     if is_expensive and ratio >= 0.5:
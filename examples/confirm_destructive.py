@@ -28,26 +28,18 @@ server = PolicyServer(
 )
 
 
-# Dangerous patterns
-DESTRUCTIVE_TOOLS = [
-    r".*delete.*",
-    r".*remove.*",
-    r".*drop.*",
-    r".*destroy.*",
-    r".*purge.*",
-    r".*truncate.*",
-    r".*wipe.*",
-    r"rm\b",
-    r"rmdir\b",
-]
-
-HIGH_RISK_TOOLS = [
-    r".*execute.*sql.*",
-    r".*run.*command.*",
-    r".*shell.*",
-    r".*exec.*",
-    r".*eval.*",
-]
+# Dangerous patterns (one case-insensitive alternation per group,
+# so each tool name is scanned once)
+DESTRUCTIVE_TOOLS = re.compile(
+    r"delete|remove|drop|destroy|purge|truncate|wipe"
+    r"|^rm\b|^rmdir\b",
+    re.IGNORECASE,
+)
+
+HIGH_RISK_TOOLS = re.compile(
+    r"execute.*sql|run.*command|shell|exec|eval",
+    re.IGNORECASE,
+)
 
 
 @server.policy(
@@ -66,23 +58,22 @@ async def confirm_delete(
     tool_args = event.payload.tool_args or {}
 
     # Check against destructive patterns
-    for pattern in DESTRUCTIVE_TOOLS:
-        if re.match(pattern, tool_name.lower()):
-            # Build informative prompt
-            target = (
-                tool_args.get("target")
-                or tool_args.get("path")
-                or tool_args.get("id")
-                or str(tool_args)
-            )
-
-            return Verdict.escalate(
-                type="human_confirm",
-                prompt=f"⚠️ Destructive action requested:\n\nTool: {tool_name}\nTarget: {target}\n\nProceed?",
-                reasoning=f"Tool '{tool_name}' matches destructive pattern",
-                options=["Proceed", "Cancel"],
-                timeout_ms=60000,  # 1 minute to decide
-            )
+    if DESTRUCTIVE_TOOLS.search(tool_name):
+        # Build informative prompt
+        target = (
+            tool_args.get("target")
+            or tool_args.get("path")
+            or tool_args.get("id")
+            or str(tool_args)
+        )
+
+        return Verdict.escalate(
+            type="human_confirm",
+            prompt=f"⚠️ Destructive action requested:\n\nTool: {tool_name}\nTarget: {target}\n\nProceed?",
+            reasoning=f"Tool '{tool_name}' matches destructive pattern",
+            options=["Proceed", "Cancel"],
+            timeout_ms=60000,  # 1 minute to decide
+        )
 
     return Verdict.allow()
 
@@ -106,26 +97,25 @@ async def warn_high_risk(
     tool_name = event.payload.tool_name or ""
     user_roles = event.metadata.user_roles or []
 
-    for pattern in HIGH_RISK_TOOLS:
-        if re.match(pattern, tool_name.lower()):
-            # Admins get a warning but can proceed
-            if "admin" in user_roles:
-                return Verdict.observe(
-                    reasoning=f"High-risk tool '{tool_name}' used by admin",
-                    trace={
-                        "tool": tool_name,
-                        "roles": user_roles,
-                    },
-                )
-
-            # Non-admins need confirmation
-            return Verdict.escalate(
-                type="human_confirm",
-                prompt=f"🔒 This operation requires elevated privileges.\n\nTool: {tool_name}\n\nRequest admin approval?",
-                reasoning=f"Non-admin user attempting high-risk tool",
-                options=["Request Approval", "Cancel"],
+    if HIGH_RISK_TOOLS.search(tool_name):
+        # Admins get a warning but can proceed
+        if "admin" in user_roles:
+            return Verdict.observe(
+                reasoning=f"High-risk tool '{tool_name}' used by admin",
+                trace={
+                    "tool": tool_name,
+                    "roles": user_roles,
+                },
             )
 
+        # Non-admins need confirmation
+        return Verdict.escalate(
+            type="human_confirm",
+            prompt=f"🔒 This operation requires elevated privileges.\n\nTool: {tool_name}\n\nRequest admin approval?",
+            reasoning=f"Non-admin user attempting high-risk tool",
+            options=["Request Approval", "Cancel"],
+        )
+
     return Verdict.allow()
 
 
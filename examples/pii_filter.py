@@ -8,6 +8,7 @@ This demonstrates the core APL developer experience: ~30 lines for a real policy
 Run: python examples/pii_filter.py
 """
 
+import asyncio
 import os
 import re
 import sys
@@ -29,30 +30,76 @@ server = PolicyServer(
 )
 
 
-# Pattern definitions
+# Pattern definitions, compiled once at import
 PATTERNS = {
     "ssn": (
-        r"\b\d{3}-\d{2}-\d{4}\b",
+        re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
         "[SSN REDACTED]",
     ),
     "credit_card": (
-        r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b",
+        re.compile(
+            r"\b\d{4}[-\s]?\d{4}[-\s]?\d{4}[-\s]?\d{4}\b"
+        ),
         "[CC REDACTED]",
     ),
     "email": (
-        r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b",
+        re.compile(
+            r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Z|a-z]{2,}\b"
+        ),
         "[EMAIL REDACTED]",
     ),
     "phone_us": (
-        r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b",
+        re.compile(
+            r"\b\d{3}[-.\s]?\d{3}[-.\s]?\d{4}\b"
+        ),
         "[PHONE REDACTED]",
     ),
     "ip_address": (
-        r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b",
+        re.compile(
+            r"\b\d{1,3}\.\d{1,3}\.\d{1,3}\.\d{1,3}\b"
+        ),
         "[IP REDACTED]",
     ),
 }
 
+# All patterns fused into one alternation so the text is scanned
+# once; the named group that matched says which PII it was
+PII_PATTERN = re.compile(
+    "|".join(
+        f"(?P<{name}>{pattern.pattern})"
+        for name, (pattern, _) in PATTERNS.items()
+    )
+)
+REPLACEMENTS = {
+    name: replacement
+    for name, (_, replacement) in PATTERNS.items()
+}
+
+# Every pattern above needs a digit or an "@", so text without
+# either can skip the PII scan entirely
+PII_TRIGGER = re.compile(r"[\d@]")
+
+# Above this size the redaction runs in a worker thread so one big
+# output doesn't stall other evaluations on the event loop
+OFFLOAD_THRESHOLD_CHARS = 16_384
+
+
+def scan_pii(text: str) -> tuple[str, list[str]]:
+    """Redact PII from text, returning it and what was found."""
+    counts = dict.fromkeys(PATTERNS, 0)
+
+    def redact(match: re.Match) -> str:
+        counts[match.lastgroup] += 1
+        return REPLACEMENTS[match.lastgroup]
+
+    redacted_text = PII_PATTERN.sub(redact, text)
+    found = [
+        f"{name}: {count} occurrence(s)"
+        for name, count in counts.items()
+        if count
+    ]
+    return redacted_text, found
+
 
 @server.policy(
     name="redact-pii",
@@ -66,25 +113,15 @@ async def redact_pii(event: PolicyEvent) -> Verdict:
     """
     text = event.payload.output_text
 
-    if not text:
+    if not text or not PII_TRIGGER.search(text):
         return Verdict.allow()
 
-    # Track what we found
-    found = []
-    redacted_text = text
-
-    for name, (
-        pattern,
-        replacement,
-    ) in PATTERNS.items():
-        matches = re.findall(pattern, redacted_text)
-        if matches:
-            found.append(
-                f"{name}: {len(matches)} occurrence(s)"
-            )
-            redacted_text = re.sub(
-                pattern, replacement, redacted_text
-            )
+    if len(text) > OFFLOAD_THRESHOLD_CHARS:
+        redacted_text, found = await asyncio.to_thread(
+            scan_pii, text
+        )
+    else:
+        redacted_text, found = scan_pii(text)
 
     if found:
         return Verdict.modify(
@@ -113,8 +150,11 @@ async def block_pii_in_tools(
     tool_args = event.payload.tool_args or {}
     args_str = str(tool_args)
 
+    if not PII_TRIGGER.search(args_str):
+        return Verdict.allow()
+
     for name, (pattern, _) in PATTERNS.items():
-        if re.search(pattern, args_str):
+        if pattern.search(args_str):
             return Verdict.deny(
                 reasoning=f"Tool call contains {name} - refusing to send to external tool",
                 confidence=0.9,
@@ -7,9 +7,10 @@ Shows:
 1. Creating policy events manually
 2. Using the decorator API
 3. Handling verdicts
+
+Runs on uvloop when it is installed (pip install uvloop).
 """
 
-import asyncio
 import os
 import sys
 
@@ -29,6 +30,7 @@ from apl import (
     SessionMetadata,
     Verdict,
 )
+from apl.utilities import run_event_loop
 
 
 async def demo_manual_evaluation():
@@ -317,4 +319,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run_event_loop(main())
@@ -82,6 +82,68 @@ class TestDenyOverridesStrategy:
         result = self.strategy.compose(verdicts)
         assert result.decision == Decision.ALLOW
 
+    def test_allow_result_is_fresh_per_call(self):
+        first = self.strategy.compose(
+            [Verdict.allow()]
+        )
+        first.modifications.append(None)
+        second = self.strategy.compose(
+            [Verdict.allow()]
+        )
+        assert first is not second
+        assert second.modifications == []
+        assert (
+            second.reasoning == "All policies allowed"
+        )
+
+    def test_deny_after_modify_returns_first_deny(
+        self,
+    ):
+        first_deny = Verdict.deny("first")
+        verdicts = [
+            Verdict.modify(
+                target="output",
+                operation="replace",
+                value="x",
+            ),
+            first_deny,
+            Verdict.deny("second"),
+        ]
+        assert (
+            self.strategy.compose(verdicts)
+            is first_deny
+        )
+
+    def test_modifications_merge_by_target(self):
+        verdicts = [
+            Verdict.modify(
+                target="output",
+                operation="replace",
+                value="a",
+                reasoning="r1",
+            ),
+            Verdict.modify(
+                target="output",
+                operation="replace",
+                value="b",
+                reasoning="r2",
+            ),
+            Verdict.modify(
+                target="tool_args",
+                operation="replace",
+                value={},
+            ),
+        ]
+        result = self.strategy.compose(verdicts)
+        assert result.decision == Decision.MODIFY
+        assert result.reasoning == "r1 + r2"
+        assert [
+            m.value for m in result.modifications
+        ] == [
+            "b",
+            {},
+        ]
+
 
 class TestUnanimousStrategy:
 
@@ -203,6 +265,37 @@ class TestWeightedStrategy:
         result = self.strategy.compose(verdicts)
         assert result.decision == Decision.ALLOW
 
+    def test_escalate_beats_high_deny_score(self):
+        verdicts = [
+            Verdict.deny("risky", confidence=0.9),
+            Verdict.escalate(
+                "human_review", reasoning="check"
+            ),
+        ]
+        result = self.strategy.compose(verdicts)
+        assert result.decision == Decision.ESCALATE
+
+    def test_allow_with_modifications_returns_modify(
+        self,
+    ):
+        verdicts = [
+            Verdict.modify(
+                target="output",
+                operation="redact",
+                value="[REDACTED]",
+            ),
+            Verdict.allow(confidence=0.9),
+            Verdict.deny("maybe", confidence=0.2),
+        ]
+        result = self.strategy.compose(verdicts)
+        assert result.decision == Decision.MODIFY
+        assert result.modifications[0].value == (
+            "[REDACTED]"
+        )
+        assert result.reasoning == (
+            "Weighted allow (0.90 vs 0.20)"
+        )
+
 
 class TestGetStrategy:
 
@@ -7,6 +7,8 @@ import pytest
 
 from apl.declarative_engine.condition_evaluator import (
     ConditionEvaluator,
+    prepare_condition,
+    prepare_when_clause,
 )
 from apl.declarative_engine.object_traversal import (
     get_nested_value_by_dot_path,
@@ -83,6 +85,20 @@ class TestConditionEvaluator:
             is True
         )
 
+    def test_matches_reuses_compiled_pattern(self):
+        from apl.declarative_engine.condition_evaluator import (
+            _compile_case_insensitive,
+        )
+
+        _compile_case_insensitive.cache_clear()
+        for text in ("drop_table", "DROP_index"):
+            self.evaluator.evaluate(
+                text, {"matches": r"drop_\w+"}
+            )
+        info = _compile_case_insensitive.cache_info()
+        assert info.misses == 1
+        assert info.hits == 1
+
     def test_matches_none_value(self):
         assert (
             self.evaluator.evaluate(
@@ -185,6 +201,113 @@ class TestConditionEvaluator:
             is False
         )
 
+    def test_frozen_in_membership(self):
+        condition = prepare_condition(
+            {"any": [{"in": ["EU", "UK"]}, "US"]}
+        )
+        assert condition["any"][0]["in"] == frozenset(
+            {"EU", "UK"}
+        )
+        assert self.evaluator.evaluate("UK", condition)
+        assert not self.evaluator.evaluate(
+            ["UK"], {"in": frozenset({"UK"})}
+        )
+
+    def test_unhashable_in_operands_stay_lists(self):
+        condition = prepare_condition(
+            {"in": [["a"], ["b"]]}
+        )
+        assert condition["in"] == [["a"], ["b"]]
+        assert self.evaluator.evaluate(
+            ["a"], condition
+        )
+
+    def test_equals_operand_is_left_literal(self):
+        literal = {"in": ["a", "b"]}
+        condition = prepare_condition(
+            {"equals": literal}
+        )
+        assert condition == {"equals": literal}
+        assert isinstance(
+            condition["equals"]["in"], list
+        )
+        assert self.evaluator.evaluate(
+            {"in": ["a", "b"]}, condition
+        )
+
+    def test_when_clause_prepares_each_path(self):
+        when = prepare_when_clause(
+            {
+                "payload.tool_name": {
+                    "in": ["rm", "dd"]
+                },
+                "metadata.user_id": "u1",
+            }
+        )
+        assert when["payload.tool_name"]["in"] == (
+            frozenset({"rm", "dd"})
+        )
+        assert when["metadata.user_id"] == "u1"
+
+    def test_any_of_contains_is_fused(self):
+        condition = prepare_condition(
+            {
+                "any": [
+                    {"contains": "market share"},
+                    {"contains": "a.b"},
+                ]
+            }
+        )
+        assert condition == {
+            "any": [
+                {
+                    "contains_any": (
+                        "market share",
+                        "a.b",
+                    )
+                }
+            ]
+        }
+        assert self.evaluator.evaluate(
+            "their market share grew", condition
+        )
+        assert not self.evaluator.evaluate(
+            "axb", condition
+        )
+        assert not self.evaluator.evaluate(
+            None, condition
+        )
+        assert self.evaluator.evaluate(
+            ["a.b"], condition
+        )
+
+    def test_any_inside_equals_is_not_fused(self):
+        literal = {"any": [{"contains": "x"}]}
+        condition = prepare_condition(
+            {"equals": literal}
+        )
+        assert condition == {"equals": literal}
+        assert self.evaluator.evaluate(
+            {"any": [{"contains": "x"}]}, condition
+        )
+
+    def test_any_under_not_is_fused(self):
+        condition = prepare_condition(
+            {"not": {"any": [{"contains": "rm -rf"}]}}
+        )
+        assert condition == {
+            "not": {
+                "any": [{"contains_any": ("rm -rf",)}]
+            }
+        }
+        assert not self.evaluator.evaluate(
+            "sudo rm -rf /", condition
+        )
+
+    def test_mixed_any_of_is_not_fused(self):
+        raw = {"any": [{"contains": "x"}, "exact"]}
+        assert prepare_condition(raw) == raw
+
     def test_not_negation(self):
         assert (
             self.evaluator.evaluate("a", {"not": "b"})
@@ -536,6 +659,42 @@ class TestRuleEvaluator:
             == "Review: danger ahead"
         )
 
+    def test_resolved_paths_shared_across_rules(self):
+        first = YAMLRule(
+            when={
+                "payload.output_text": {
+                    "contains": "nope"
+                }
+            },
+            then={"decision": "deny"},
+        )
+        second = YAMLRule(
+            when={
+                "payload.output_text": {
+                    "contains": "fine"
+                }
+            },
+            then={"decision": "observe"},
+        )
+        event = self._make_event(output_text="fine")
+        resolved_paths: dict = {}
+
+        assert (
+            self.evaluator.evaluate_rule_against_event(
+                first, event, resolved_paths
+            )
+            is None
+        )
+        assert resolved_paths == {
+            "payload.output_text": "fine"
+        }
+        result = (
+            self.evaluator.evaluate_rule_against_event(
+                second, event, resolved_paths
+            )
+        )
+        assert result.decision == Decision.OBSERVE
+
 
 class TestYAMLSchema:
 
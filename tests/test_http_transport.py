@@ -0,0 +1,629 @@
+from __future__ import annotations
+
+import asyncio
+
+import pytest
+from aiohttp.test_utils import TestClient, TestServer
+
+from apl.logging import APLLogger
+from apl.server import PolicyServer
+from apl.transports.http import HTTPTransport
+from apl.transports.http.app_factory import (
+    create_http_application,
+)
+from apl.transports.http.batch_dispatcher import (
+    BatchDispatcher,
+)
+from apl.transports.http.routes.sse_route import (
+    KEEPALIVE_FRAME,
+)
+from apl.types import EventPayload, Verdict
+
+
+def _build_server() -> PolicyServer:
+    server = PolicyServer("http-test", version="1.2.3")
+
+    @server.policy(
+        name="no-secrets",
+        events=["output.pre_send"],
+    )
+    async def no_secrets(event):
+        if "SECRET" in (
+            event.payload.output_text or ""
+        ):
+            return Verdict.deny("Contains secret")
+        return Verdict.allow()
+
+    return server
+
+
+@pytest.fixture
+async def client():
+    app = create_http_application(_build_server())
+    async with TestClient(TestServer(app)) as c:
+        yield c
+
+
+class TestHTTPTransport:
+
+    @pytest.mark.asyncio
+    async def test_evaluate_allow(self, client):
+        resp = await client.post(
+            "/evaluate",
+            json={
+                "type": "output.pre_send",
+                "payload": {"output_text": "hello"},
+            },
+        )
+        assert resp.status == 200
+        assert resp.content_type == "application/json"
+        data = await resp.json()
+        assert (
+            data["composed_verdict"]["decision"]
+            == "allow"
+        )
+        assert len(data["verdicts"]) == 1
+
+    @pytest.mark.asyncio
+    async def test_evaluate_deny(self, client):
+        resp = await client.post(
+            "/evaluate",
+            json={
+                "type": "output.pre_send",
+                "payload": {"output_text": "a SECRET"},
+            },
+        )
+        data = await resp.json()
+        assert (
+            data["composed_verdict"]["decision"]
+            == "deny"
+        )
+
+    @pytest.mark.asyncio
+    async def test_evaluate_missing_type(self, client):
+        resp = await client.post(
+            "/evaluate", json={"payload": {}}
+        )
+        assert resp.status == 400
+        data = await resp.json()
+        assert "type" in data["error"]
+
+    @pytest.mark.asyncio
+    async def test_evaluate_type_nested_not_top_level(
+        self, client
+    ):
+        resp = await client.post(
+            "/evaluate",
+            json={
+                "payload": {"tool_args": {"type": 1}}
+            },
+        )
+        assert resp.status == 400
+
+    @pytest.mark.asyncio
+    async def test_evaluate_invalid_json(self, client):
+        resp = await client.post(
+            "/evaluate", data=b'{"type": not json'
+        )
+        assert resp.status == 400
+        data = await resp.json()
+        assert data["error"] == "Invalid JSON"
+        assert data["detail"]
+
+    @pytest.mark.asyncio
+    async def test_evaluate_batch(self, client):
+        resp = await client.post(
+            "/evaluate/batch",
+            json={
+                "events": [
+                    {
+                        "type": "output.pre_send",
+                        "payload": {
+                            "output_text": text
+                        },
+                    }
+                    for text in ("hello", "a SECRET")
+                ]
+            },
+        )
+        assert resp.status == 200
+        data = await resp.json()
+        assert [
+            r["composed_verdict"]["decision"]
+            for r in data["results"]
+        ] == ["allow", "deny"]
+
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_splits_latency(
+        self, client
+    ):
+        resp = await client.post(
+            "/evaluate/batch",
+            json={
+                "events": [
+                    {"type": "output.pre_send"}
+                    for _ in range(4)
+                ]
+            },
+        )
+        data = await resp.json()
+        metrics = client.server.app["metrics"]
+        assert metrics.latency_count == 4
+        assert metrics.latency_sum_ms == pytest.approx(
+            data["evaluation_ms"], abs=0.01
+        )
+
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_isolates_failures(
+        self, client
+    ):
+        registry = client.server.app[
+            "server"
+        ]._registry
+        original = registry._evaluate_with_handlers
+
+        async def failing_for_secrets(event, handlers):
+            if "SECRET" in (
+                event.payload.output_text or ""
+            ):
+                raise RuntimeError("boom")
+            return await original(event, handlers)
+
+        registry._evaluate_with_handlers = (
+            failing_for_secrets
+        )
+
+        resp = await client.post(
+            "/evaluate/batch",
+            json={
+                "events": [
+                    {
+                        "type": "output.pre_send",
+                        "payload": {
+                            "output_text": text
+                        },
+                    }
+                    for text in ("hello", "a SECRET")
+                ]
+            },
+        )
+        assert resp.status == 200
+        ok, failed = (await resp.json())["results"]
+        assert (
+            ok["composed_verdict"]["decision"]
+            == "allow"
+        )
+        assert failed["error"] == "boom"
+        assert "verdicts" not in failed
+        metrics = client.server.app["metrics"]
+        assert metrics.errors_total == 1
+
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_requires_types(
+        self, client
+    ):
+        missing_events = await client.post(
+            "/evaluate/batch", json={}
+        )
+        missing_type = await client.post(
+            "/evaluate/batch",
+            json={"events": [{"payload": {}}]},
+        )
+        assert missing_events.status == 400
+        assert missing_type.status == 400
+
+    @pytest.mark.asyncio
+    async def test_cors_headers_on_response(
+        self, client
+    ):
+        resp = await client.get("/health")
+        assert (
+            resp.headers["Access-Control-Allow-Origin"]
+            == "*"
+        )
+
+    @pytest.mark.asyncio
+    async def test_cors_preflight(self, client):
+        resp = await client.options("/evaluate")
+        assert resp.status == 204
+        assert (
+            resp.headers[
+                "Access-Control-Allow-Methods"
+            ]
+            == "GET, POST, OPTIONS"
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_ids_are_unique(
+        self, client
+    ):
+        first = await client.get("/health")
+        second = await client.get("/health")
+        assert (
+            first.headers["X-Request-ID"]
+            != second.headers["X-Request-ID"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_request_id_is_echoed(self, client):
+        resp = await client.get(
+            "/health", headers={"X-Request-ID": "abc"}
+        )
+        assert resp.headers["X-Request-ID"] == "abc"
+
+    @pytest.mark.asyncio
+    async def test_manifest(self, client):
+        resp = await client.get("/manifest")
+        assert resp.status == 200
+        data = await resp.json()
+        assert data["server_name"] == "http-test"
+        assert data["policies"][0]["events"] == [
+            "output.pre_send"
+        ]
+
+    @pytest.mark.asyncio
+    async def test_manifest_etag_not_modified(
+        self, client
+    ):
+        first = await client.get("/manifest")
+        etag = first.headers["ETag"]
+        second = await client.get(
+            "/manifest",
+            headers={"If-None-Match": etag},
+        )
+        assert second.status == 304
+        assert second.headers["ETag"] == etag
+
+    @pytest.mark.asyncio
+    async def test_manifest_refreshes_after_register(
+        self, client
+    ):
+        first = await client.get("/manifest")
+        server = client.server.app["server"]
+
+        @server.policy(
+            name="late", events=["input.received"]
+        )
+        async def late(event):
+            return Verdict.allow()
+
+        second = await client.get("/manifest")
+        data = await second.json()
+        assert len(data["policies"]) == 2
+        assert (
+            second.headers["ETag"]
+            != first.headers["ETag"]
+        )
+
+    @pytest.mark.asyncio
+    async def test_root_redirects_to_health(
+        self, client
+    ):
+        resp = await client.get(
+            "/", allow_redirects=False
+        )
+        assert resp.status == 302
+        assert resp.headers["Location"] == "/health"
+
+    @pytest.mark.asyncio
+    async def test_health(self, client):
+        resp = await client.get("/health")
+        data = await resp.json()
+        assert data["status"] == "healthy"
+        assert data["policies_loaded"] == 1
+        assert "uptime_seconds" in data
+
+    @pytest.mark.asyncio
+    async def test_metrics_counts_requests(
+        self, client
+    ):
+        await client.post(
+            "/evaluate",
+            json={"type": "output.pre_send"},
+        )
+        resp = await client.get("/metrics")
+        assert resp.status == 200
+        text = await resp.text()
+        assert "apl_requests_total 1" in text
+
+    @pytest.mark.asyncio
+    async def test_metrics_refresh_after_new_request(
+        self, client
+    ):
+        await client.get("/metrics")
+        await client.post(
+            "/evaluate",
+            json={"type": "output.pre_send"},
+        )
+        resp = await client.get("/metrics")
+        text = await resp.text()
+        assert "apl_requests_total 1" in text
+
+    @pytest.mark.asyncio
+    async def test_concurrent_evaluations(
+        self, client
+    ):
+        responses = await asyncio.gather(
+            *(
+                client.post(
+                    "/evaluate",
+                    json={
+                        "type": "output.pre_send",
+                        "payload": {
+                            "output_text": (
+                                "SECRET"
+                                if i % 2
+                                else "fine"
+                            )
+                        },
+                    },
+                )
+                for i in range(10)
+            )
+        )
+        decisions = [
+            (await r.json())["composed_verdict"][
+                "decision"
+            ]
+            for r in responses
+        ]
+        assert decisions == ["allow", "deny"] * 5
+
+    @pytest.mark.asyncio
+    async def test_large_verdict_list_is_streamed(
+        self,
+    ):
+        server = _build_server()
+        for i in range(40):
+
+            @server.policy(
+                name=f"extra-{i}",
+                events=["output.pre_send"],
+            )
+            async def extra(event):
+                return Verdict.allow("fine")
+
+        app = create_http_application(server)
+        async with TestClient(TestServer(app)) as c:
+            resp = await c.post(
+                "/evaluate",
+                json={"type": "output.pre_send"},
+            )
+            assert resp.status == 200
+            assert "X-Request-ID" in resp.headers
+            data = await resp.json()
+
+        assert len(data["verdicts"]) == 41
+        assert (
+            data["composed_verdict"]["decision"]
+            == "allow"
+        )
+        assert isinstance(data["evaluation_ms"], float)
+
+    @pytest.mark.asyncio
+    async def test_sse_subscribers_share_keepalive(
+        self, client
+    ):
+        broadcaster = client.server.app[
+            "sse_broadcaster"
+        ]
+        first = await client.get("/events")
+        second = await client.get("/events")
+
+        assert (
+            await first.content.readexactly(
+                len(KEEPALIVE_FRAME)
+            )
+            == KEEPALIVE_FRAME
+        )
+        await second.content.readexactly(
+            len(KEEPALIVE_FRAME)
+        )
+        assert broadcaster.client_count == 2
+
+        await broadcaster.broadcast(KEEPALIVE_FRAME)
+        assert (
+            await first.content.readexactly(
+                len(KEEPALIVE_FRAME)
+            )
+            == KEEPALIVE_FRAME
+        )
+        assert (
+            await second.content.readexactly(
+                len(KEEPALIVE_FRAME)
+            )
+            == KEEPALIVE_FRAME
+        )
+
+        first.close()
+        second.close()
+
+
+class TestBatchDispatcher:
+
+    @pytest.mark.asyncio
+    async def test_coalesces_concurrent_submissions(
+        self, make_event
+    ):
+        server = _build_server()
+        batch_sizes: list[int] = []
+        original = server.evaluate_batch
+
+        async def recording_evaluate_batch(events):
+            batch_sizes.append(len(events))
+            return await original(events)
+
+        server.evaluate_batch = (
+            recording_evaluate_batch
+        )
+
+        dispatcher = BatchDispatcher(server)
+        await dispatcher.start()
+        try:
+            results = await asyncio.gather(
+                *(
+                    dispatcher.submit(make_event())
+                    for _ in range(5)
+                )
+            )
+        finally:
+            await dispatcher.stop()
+
+        assert batch_sizes == [5]
+        assert all(len(r) == 1 for r in results)
+
+    @pytest.mark.asyncio
+    async def test_respects_max_batch_size(
+        self, make_event
+    ):
+        server = _build_server()
+        batch_sizes: list[int] = []
+        original = server.evaluate_batch
+
+        async def recording_evaluate_batch(events):
+            batch_sizes.append(len(events))
+            return await original(events)
+
+        server.evaluate_batch = (
+            recording_evaluate_batch
+        )
+
+        dispatcher = BatchDispatcher(
+            server, max_batch_size=2
+        )
+        await dispatcher.start()
+        try:
+            await asyncio.gather(
+                *(
+                    dispatcher.submit(make_event())
+                    for _ in range(5)
+                )
+            )
+        finally:
+            await dispatcher.stop()
+
+        assert sorted(batch_sizes) == [1, 2, 2]
+
+    @pytest.mark.asyncio
+    async def test_lone_submission_does_not_wait(
+        self, make_event
+    ):
+        dispatcher = BatchDispatcher(
+            _build_server(), max_wait_ms=5000
+        )
+        await dispatcher.start()
+        try:
+            verdicts = await asyncio.wait_for(
+                dispatcher.submit(make_event()),
+                timeout=1,
+            )
+        finally:
+            await dispatcher.stop()
+
+        assert verdicts[0].policy_name == "no-secrets"
+
+    @pytest.mark.asyncio
+    async def test_stop_fails_undispatched_batch(
+        self, make_event
+    ):
+        dispatcher = BatchDispatcher(
+            _build_server(), max_wait_ms=5000
+        )
+        await dispatcher.start()
+        submissions = [
+            asyncio.ensure_future(
+                dispatcher.submit(make_event())
+            )
+            for _ in range(2)
+        ]
+        await asyncio.sleep(0.01)
+        await dispatcher.stop()
+
+        results = await asyncio.wait_for(
+            asyncio.gather(
+                *submissions, return_exceptions=True
+            ),
+            timeout=1,
+        )
+        assert all(
+            isinstance(r, RuntimeError)
+            for r in results
+        )
+
+    @pytest.mark.asyncio
+    async def test_failure_is_isolated_per_event(
+        self, make_event
+    ):
+        server = _build_server()
+        original = (
+            server._registry._evaluate_with_handlers
+        )
+
+        async def failing_for_secrets(event, handlers):
+            if "SECRET" in (
+                event.payload.output_text or ""
+            ):
+                raise RuntimeError("boom")
+            return await original(event, handlers)
+
+        server._registry._evaluate_with_handlers = (
+            failing_for_secrets
+        )
+
+        dispatcher = BatchDispatcher(server)
+        await dispatcher.start()
+        try:
+            ok, failed = await asyncio.gather(
+                dispatcher.submit(
+                    make_event(
+                        payload=EventPayload(
+                            output_text="fine"
+                        )
+                    )
+                ),
+                dispatcher.submit(
+                    make_event(
+                        payload=EventPayload(
+                            output_text="SECRET"
+                        )
+                    )
+                ),
+                return_exceptions=True,
+            )
+        finally:
+            await dispatcher.stop()
+
+        assert len(ok) == 1
+        assert isinstance(failed, RuntimeError)
+
+    @pytest.mark.asyncio
+    async def test_submit_without_start_evaluates_directly(
+        self, make_event
+    ):
+        dispatcher = BatchDispatcher(_build_server())
+        verdicts = await dispatcher.submit(
+            make_event()
+        )
+        assert verdicts[0].policy_name == "no-secrets"
+
+
+class TestHTTPTransportSite:
+
+    @pytest.mark.asyncio
+    async def test_start_and_stop_with_socket_options(
+        self,
+    ):
+        transport = HTTPTransport(
+            _build_server(),
+            host="127.0.0.1",
+            port=0,
+            apl_logger=APLLogger("test"),
+            reuse_port=True,
+            backlog=256,
+        )
+        await transport.start()
+        try:
+            addresses = transport._runner.addresses
+            assert len(addresses) == 1
+        finally:
+            await transport.stop()
@@ -1,5 +1,9 @@
 from __future__ import annotations
 
+from apl.instrumentation import (
+    auto_instrument,
+    uninstrument,
+)
 from apl.instrumentation.events import (
     EVENT_REGISTRY,
     get_event,
@@ -52,6 +56,10 @@ from apl.instrumentation.execution import (
     StreamingLifecycleExecutor,
     SyncLifecycleExecutor,
 )
+from apl.instrumentation.state import (
+    InstrumentationState,
+)
+from apl.layer import PolicyLayer
 from apl.types import (
     Decision,
     EventPayload,
@@ -229,3 +237,60 @@ class TestExecutorInheritance:
             StreamingLifecycleExecutor,
             BaseLifecycleExecutor,
         )
+
+
+class TestInstrumentationState:
+
+    def test_session_metadata_keeps_budget_changes(
+        self,
+    ):
+        state = InstrumentationState(
+            policy_layer=PolicyLayer(), user_id="u1"
+        )
+        state.metadata.token_budget = 500
+        state.metadata.token_count = 120
+
+        first = state.session_metadata
+        second = state.session_metadata
+        assert first is not second
+        assert first is not state.metadata
+        assert second.token_budget == 500
+        assert second.token_count == 120
+        assert second.user_id == "u1"
+
+    def test_session_metadata_tracks_identity_fields(
+        self,
+    ):
+        state = InstrumentationState(
+            policy_layer=PolicyLayer(), session_id="s1"
+        )
+        state.user_id = "later"
+        assert (
+            state.session_metadata.user_id == "later"
+        )
+        assert (
+            state.session_metadata.session_id == "s1"
+        )
+
+
+class TestAutoInstrument:
+
+    def test_quiet_skips_console_output(self, capsys):
+        state = auto_instrument(
+            ["stdio://./policy.py"],
+            enabled_providers=["missing"],
+            quiet=True,
+        )
+        uninstrument(state)
+        assert state.quiet is True
+        assert capsys.readouterr().out == ""
+
+    def test_reports_by_default(self, capsys):
+        state = auto_instrument(
+            ["stdio://./policy.py"],
+            enabled_providers=["missing"],
+        )
+        uninstrument(state)
+        out = capsys.readouterr().out
+        assert "stdio://./policy.py" in out
+        assert "instrumentation removed" in out
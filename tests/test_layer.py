@@ -1,12 +1,19 @@
 from __future__ import annotations
 
+import asyncio
+import subprocess
+import sys
+
 import pytest
+from aiohttp.test_utils import TestServer
 
 from apl.layer.client_transports import (
     resolve_client_transport_for_uri,
 )
 from apl.layer.client_transports.http_client_transport import (
+    CONNECTIONS_PER_HOST,
     HttpClientTransport,
+    create_client_session,
 )
 from apl.layer.client_transports.stdio_client_transport import (
     StdioClientTransport,
@@ -17,7 +24,14 @@ from apl.layer.exceptions import (
     PolicyEscalation,
 )
 from apl.layer.policy_client import PolicyClient
+from apl.layer.policy_layer import PolicyLayer
+from apl.server import PolicyServer
+from apl.transports.http.app_factory import (
+    create_http_application,
+)
 from apl.types import (
+    CompositionConfig,
+    CompositionMode,
     Decision,
     EventPayload,
     EventType,
@@ -129,8 +143,279 @@ class TestTransportResolution:
             )
 
 
+class TestHttpClientTransport:
+
+    def test_importing_apl_defers_aiohttp(self):
+        result = subprocess.run(
+            [
+                sys.executable,
+                "-c",
+                "import sys, apl; "
+                "print('aiohttp' in sys.modules)",
+            ],
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+        assert result.stdout.strip() == "False"
+
+    @pytest.mark.asyncio
+    async def test_reuses_keepalive_connection(self):
+        server = PolicyServer("remote")
+
+        @server.policy(
+            name="allow-all", events=["input.received"]
+        )
+        async def allow_all(event):
+            return Verdict.allow()
+
+        async with TestServer(
+            create_http_application(server)
+        ) as test_server:
+            transport = HttpClientTransport(
+                str(test_server.make_url(""))
+            )
+            manifest = await transport.connect()
+            try:
+                connector = (
+                    transport._session.connector
+                )
+                assert (
+                    connector.limit_per_host
+                    == CONNECTIONS_PER_HOST
+                )
+                assert (
+                    manifest["server_name"] == "remote"
+                )
+                for _ in range(3):
+                    verdicts = (
+                        await transport.evaluate(
+                            {"type": "input.received"}
+                        )
+                    )
+                    assert (
+                        verdicts[0]["decision"]
+                        == "allow"
+                    )
+                assert (
+                    len(
+                        test_server.runner.server.connections
+                    )
+                    == 1
+                )
+            finally:
+                await transport.close()
+
+    @pytest.mark.asyncio
+    async def test_layer_shares_one_session(self):
+        server = PolicyServer("remote")
+
+        @server.policy(
+            name="allow-all", events=["input.received"]
+        )
+        async def allow_all(event):
+            return Verdict.allow()
+
+        async with TestServer(
+            create_http_application(server)
+        ) as test_server:
+            url = str(test_server.make_url(""))
+            layer = PolicyLayer()
+            layer.add_server(url).add_server(url)
+            await layer.connect()
+
+            sessions = {
+                id(client._transport._session)
+                for client in layer._clients
+            }
+            shared = layer._http_session
+            assert len(sessions) == 1
+            assert not shared.closed
+
+            await layer.close()
+            assert shared.closed
+            assert layer._http_session is None
+
+    @pytest.mark.asyncio
+    async def test_layer_uses_caller_session(self):
+        server = PolicyServer("remote")
+
+        @server.policy(
+            name="allow-all", events=["input.received"]
+        )
+        async def allow_all(event):
+            return Verdict.allow()
+
+        async with TestServer(
+            create_http_application(server)
+        ) as test_server:
+            session = create_client_session()
+            layer = PolicyLayer(http_session=session)
+            layer.add_server(
+                str(test_server.make_url(""))
+            )
+            try:
+                verdict = await layer.evaluate(
+                    "input.received"
+                )
+                transport = layer._clients[
+                    0
+                ]._transport
+                assert transport._session is session
+                await layer.close()
+                assert not session.closed
+            finally:
+                await session.close()
+
+        assert verdict.decision == Decision.ALLOW
+
+
+_STDIO_POLICY_SOURCE = """
+from apl import PolicyServer, Verdict
+
+server = PolicyServer("stdio-remote")
+
+
+@server.policy(name="allow-all", events=["input.received"])
+async def allow_all(event):
+    return Verdict.allow("ok")
+
+
+server.run()
+"""
+
+
+class TestStdioClientTransport:
+
+    @pytest.mark.asyncio
+    async def test_round_trip(self, tmp_path):
+        policy_file = tmp_path / "policy.py"
+        policy_file.write_text(_STDIO_POLICY_SOURCE)
+        transport = StdioClientTransport(
+            f"stdio://{sys.executable} {policy_file}"
+        )
+        manifest = await transport.connect()
+        try:
+            verdicts = await transport.evaluate(
+                {"type": "input.received"}
+            )
+        finally:
+            await transport.close()
+
+        assert (
+            manifest["server_name"] == "stdio-remote"
+        )
+        assert verdicts[0]["reasoning"] == "ok"
+
+
 class TestPolicyClient:
 
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_over_http(
+        self, make_event
+    ):
+        server = PolicyServer("remote")
+
+        @server.policy(
+            name="allow-all", events=["input.received"]
+        )
+        async def allow_all(event):
+            return Verdict.allow()
+
+        async with TestServer(
+            create_http_application(server)
+        ) as test_server:
+            client = PolicyClient(
+                str(test_server.make_url(""))
+            )
+            try:
+                results = await client.evaluate_batch(
+                    [
+                        make_event(
+                            EventType.INPUT_RECEIVED
+                        )
+                        for _ in range(2)
+                    ]
+                )
+            finally:
+                await client.close()
+
+        assert len(results) == 2
+        assert all(
+            verdicts[0].policy_name == "allow-all"
+            for verdicts in results
+        )
+
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_falls_back_per_event(
+        self, make_event
+    ):
+        server = PolicyServer("remote")
+
+        @server.policy(
+            name="allow-all", events=["input.received"]
+        )
+        async def allow_all(event):
+            return Verdict.allow()
+
+        original = (
+            server._registry._evaluate_with_handlers
+        )
+
+        async def failing_for_bad(event, handlers):
+            if event.payload.output_text == "bad":
+                raise RuntimeError("boom")
+            return await original(event, handlers)
+
+        server._registry._evaluate_with_handlers = (
+            failing_for_bad
+        )
+
+        async with TestServer(
+            create_http_application(server)
+        ) as test_server:
+            client = PolicyClient(
+                str(test_server.make_url(""))
+            )
+            try:
+                good, bad = (
+                    await client.evaluate_batch(
+                        [
+                            make_event(
+                                EventType.INPUT_RECEIVED,
+                                payload=EventPayload(
+                                    output_text=text
+                                ),
+                            )
+                            for text in ("good", "bad")
+                        ]
+                    )
+                )
+            finally:
+                await client.close()
+
+        assert good[0].policy_name == "allow-all"
+        assert bad[0].reasoning == (
+            "No response from policy server"
+        )
+
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_rejects_short_reply(
+        self, make_event
+    ):
+        class _ShortTransport:
+            async def evaluate_batch(self, events):
+                return [[]]
+
+        client = PolicyClient("http://localhost:8080")
+        client._transport = _ShortTransport()
+        client._is_connected = True
+
+        with pytest.raises(ConnectionError):
+            await client.evaluate_batch(
+                [make_event(), make_event()]
+            )
+
     def test_client_creation(self):
         client = PolicyClient("stdio://./test.py")
         assert client.uri == "stdio://./test.py"
@@ -144,6 +429,287 @@ class TestPolicyClient:
         assert client._verdict_serializer is not None
 
 
+class _StubClient:
+
+    def __init__(
+        self, verdicts: list[Verdict], delay: float = 0
+    ) -> None:
+        self._verdicts = verdicts
+        self._delay = delay
+        self.finished = False
+        self.calls = 0
+
+    async def evaluate(
+        self, event, serialized_event=None
+    ):
+        self.calls += 1
+        self.serialized_event = serialized_event
+        await asyncio.sleep(self._delay)
+        self.finished = True
+        return self._verdicts
+
+    async def close(self):
+        self.closed_after_finish = self.finished
+
+
+def _layer_with_clients(
+    clients: list[_StubClient],
+    mode: CompositionMode = CompositionMode.DENY_OVERRIDES,
+) -> PolicyLayer:
+    layer = PolicyLayer(CompositionConfig(mode=mode))
+    layer._clients = clients
+    layer._is_connected = True
+    return layer
+
+
+class TestPolicyLayer:
+
+    @pytest.mark.asyncio
+    async def test_deny_returns_before_slow_servers(
+        self,
+    ):
+        slow = _StubClient([Verdict.allow()], delay=5)
+        layer = _layer_with_clients(
+            [_StubClient([Verdict.deny("no")]), slow]
+        )
+
+        verdict = await asyncio.wait_for(
+            layer.evaluate("input.received"), timeout=1
+        )
+
+        assert verdict.decision == Decision.DENY
+        assert slow.finished is False
+        assert len(layer._background_evaluations) == 1
+        for task in layer._background_evaluations:
+            task.cancel()
+
+    @pytest.mark.asyncio
+    async def test_deny_is_reported_in_server_order(
+        self,
+    ):
+        layer = _layer_with_clients(
+            [
+                _StubClient(
+                    [Verdict.deny("first")], delay=0.05
+                ),
+                _StubClient([Verdict.deny("second")]),
+            ]
+        )
+
+        verdict = await layer.evaluate(
+            "input.received"
+        )
+
+        assert verdict.reasoning == "first"
+
+    @pytest.mark.asyncio
+    async def test_deny_waits_for_earlier_servers(
+        self,
+    ):
+        earlier = _StubClient(
+            [Verdict.allow()], delay=0.05
+        )
+        layer = _layer_with_clients(
+            [
+                earlier,
+                _StubClient([Verdict.deny("no")]),
+            ]
+        )
+
+        verdict = await layer.evaluate(
+            "input.received"
+        )
+
+        assert verdict.reasoning == "no"
+        assert earlier.finished is True
+
+    @pytest.mark.asyncio
+    async def test_close_waits_for_background_evaluations(
+        self,
+    ):
+        slow = _StubClient(
+            [Verdict.allow()], delay=0.05
+        )
+        layer = _layer_with_clients(
+            [_StubClient([Verdict.deny("no")]), slow]
+        )
+
+        await layer.evaluate("input.received")
+        assert slow.finished is False
+
+        await layer.close()
+        assert slow.closed_after_finish is True
+        assert not layer._background_evaluations
+
+    @pytest.mark.asyncio
+    async def test_verdicts_keep_server_order(self):
+        layer = _layer_with_clients(
+            [
+                _StubClient(
+                    [
+                        Verdict.modify(
+                            target="output",
+                            operation="replace",
+                            value="first",
+                        )
+                    ],
+                    delay=0.02,
+                ),
+                _StubClient(
+                    [
+                        Verdict.modify(
+                            target="output",
+                            operation="replace",
+                            value="second",
+                        )
+                    ]
+                ),
+            ]
+        )
+
+        verdict = await layer.evaluate(
+            "output.pre_send"
+        )
+
+        assert verdict.decision == Decision.MODIFY
+        assert verdict.modifications[0].value == (
+            "second"
+        )
+
+    @pytest.mark.asyncio
+    async def test_other_modes_wait_for_all_servers(
+        self,
+    ):
+        slow = _StubClient(
+            [Verdict.allow(confidence=0.9)], delay=0.02
+        )
+        layer = _layer_with_clients(
+            [
+                slow,
+                _StubClient(
+                    [
+                        Verdict.deny(
+                            "no", confidence=0.1
+                        )
+                    ]
+                ),
+            ],
+            mode=CompositionMode.WEIGHTED,
+        )
+
+        verdict = await layer.evaluate(
+            "input.received"
+        )
+
+        assert slow.finished is True
+        assert verdict.decision == Decision.ALLOW
+
+    @pytest.mark.asyncio
+    async def test_event_is_serialized_once(self):
+        first = _StubClient([Verdict.allow()])
+        second = _StubClient([Verdict.allow()])
+        layer = _layer_with_clients(
+            [first, second],
+            mode=CompositionMode.WEIGHTED,
+        )
+
+        await layer.evaluate("input.received")
+
+        assert (
+            first.serialized_event["type"]
+            == "input.received"
+        )
+        assert (
+            first.serialized_event
+            is second.serialized_event
+        )
+
+
+class TestDecoratorVerdictCache:
+
+    @pytest.mark.asyncio
+    async def test_repeated_call_reuses_verdict(self):
+        client = _StubClient([Verdict.allow()])
+        layer = _layer_with_clients([client])
+
+        @layer.on(
+            "tool.pre_invoke", cache_ttl_seconds=30
+        )
+        async def run_tool(tool_name, tool_args):
+            return tool_name
+
+        await run_tool("read_file", {"path": "a"})
+        await run_tool("read_file", {"path": "a"})
+        assert client.calls == 1
+
+        await run_tool("read_file", {"path": "b"})
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_escalations_are_not_cached(self):
+        client = _StubClient(
+            [Verdict.escalate("human_confirm")]
+        )
+        layer = _layer_with_clients([client])
+
+        @layer.on(
+            "tool.pre_invoke", cache_ttl_seconds=30
+        )
+        async def run_tool(tool_name, tool_args):
+            return tool_name
+
+        for _ in range(2):
+            with pytest.raises(PolicyEscalation):
+                await run_tool("transfer", {})
+        assert client.calls == 2
+
+    @pytest.mark.asyncio
+    async def test_key_ignores_argument_order(self):
+        client = _StubClient([Verdict.allow()])
+        layer = _layer_with_clients([client])
+
+        @layer.on(
+            "tool.pre_invoke", cache_ttl_seconds=30
+        )
+        async def run_tool(tool_name, tool_args):
+            return tool_name
+
+        await run_tool(
+            "copy", {"src": "a", "dst": "b"}
+        )
+        await run_tool(
+            "copy", {"dst": "b", "src": "a"}
+        )
+        assert client.calls == 1
+
+    @pytest.mark.asyncio
+    async def test_non_json_arguments_are_not_cached(
+        self,
+    ):
+        client = _StubClient([Verdict.allow()])
+        layer = _layer_with_clients([client])
+
+        @layer.on(
+            "tool.pre_invoke", cache_ttl_seconds=30
+        )
+        async def run_tool(tool_name, tool_args):
+            return tool_name
+
+        handle = object()
+        for _ in range(2):
+            await run_tool("write", {"fh": handle})
+        assert client.calls == 2
+
+    def test_rejects_messages_from(self):
+        layer = PolicyLayer()
+        with pytest.raises(ValueError):
+            layer.on(
+                "tool.pre_invoke",
+                messages_from=list,
+                cache_ttl_seconds=30,
+            )
+
+
 class TestExceptions:
 
     def test_policy_denied(self):
@@ -1,7 +1,11 @@
 from __future__ import annotations
 
+import logging
+import logging.handlers
+
 from apl.logging import (
     APLLogger,
+    APLRichHandler,
     get_logger,
     setup_logging,
 )
@@ -9,6 +13,7 @@ from apl.metrics.prometheus_exporter import (
     export_metrics_to_prometheus,
 )
 from apl.metrics.server_metrics import ServerMetrics
+from apl.types import Verdict
 
 
 class TestServerMetrics:
@@ -32,6 +37,63 @@ class TestServerMetrics:
         m.record_error()
         assert m.errors_total == 1
 
+    def test_counts_by_label(self):
+        m = ServerMetrics()
+        m.record_request(
+            "output.pre_send", "allow", 1.0
+        )
+        m.record_request(
+            "output.pre_send", "deny", 1.0
+        )
+        m.record_request(
+            "tool.pre_invoke", "deny", 1.0
+        )
+        assert m.requests_by_event_type == {
+            "tool.pre_invoke": 1,
+            "output.pre_send": 2,
+        }
+        assert m.verdicts_by_decision == {
+            "allow": 1,
+            "deny": 2,
+        }
+
+    def test_unknown_labels_are_counted(self):
+        m = ServerMetrics()
+        m.record_request("custom.event", "custom", 1.0)
+        assert m.requests_by_event_type == {
+            "custom.event": 1
+        }
+        assert m.verdicts_by_decision == {"custom": 1}
+
+    def test_uptime_is_monotonic(self):
+        m = ServerMetrics()
+        first = m.uptime_seconds
+        assert first >= 0
+        assert m.uptime_seconds >= first
+
+    def test_counters_are_plain_fields(self):
+        m = ServerMetrics(
+            requests_by_event_type={
+                "output.pre_send": 3
+            }
+        )
+        m.record_request(
+            "output.pre_send", "allow", 1.0
+        )
+        m.verdicts_by_decision["deny"] = 5
+        assert m.requests_by_event_type == {
+            "output.pre_send": 4
+        }
+        assert m.verdicts_by_decision["deny"] == 5
+
+    def test_version_bumps_on_change(self):
+        m = ServerMetrics()
+        m.record_request(
+            "output.pre_send", "allow", 1.0
+        )
+        m.record_error()
+        assert m.version == 2
+
 
 class TestPrometheusExporter:
 
@@ -56,3 +118,59 @@ class TestLogging:
 
     def test_setup_logging_runs_without_error(self):
         setup_logging(level="DEBUG")
+
+    def test_background_logging_writes_to_file(
+        self, tmp_path
+    ):
+        log_file = tmp_path / "apl.log"
+        logger = setup_logging(
+            level="INFO",
+            rich_output=False,
+            log_file=str(log_file),
+            background=True,
+        )
+        try:
+            root = logging.getLogger("apl")
+            assert isinstance(
+                root.handlers[0],
+                logging.handlers.QueueHandler,
+            )
+            logger.info("queued message")
+        finally:
+            setup_logging(
+                level="INFO", rich_output=False
+            )
+
+        assert "queued message" in log_file.read_text()
+
+    def test_non_tty_output_strips_markup(
+        self, capsys
+    ):
+        logger = setup_logging(level="INFO")
+        try:
+            logger.policy_evaluated(
+                "pii-filter", Verdict.deny("blocked")
+            )
+        finally:
+            setup_logging(
+                level="INFO", rich_output=False
+            )
+
+        err = capsys.readouterr().err
+        assert "pii-filter" in err
+        assert "DENY" in err
+        assert "[policy.deny]" not in err
+
+    def test_explicit_rich_output_is_honoured(self):
+        try:
+            setup_logging(
+                level="INFO", rich_output=True
+            )
+            root = logging.getLogger("apl")
+            assert isinstance(
+                root.handlers[0], APLRichHandler
+            )
+        finally:
+            setup_logging(
+                level="INFO", rich_output=False
+            )
@@ -1,8 +1,14 @@
 from __future__ import annotations
 
+import json
+
+import pytest
+
 from apl.serialization import (
     EventSerializer,
     VerdictSerializer,
+    decode_json,
+    encode_json,
 )
 from apl.types import (
     Decision,
@@ -137,6 +143,12 @@ class TestVerdictSerializer:
         assert v.decision == Decision.ALLOW
         assert v.confidence == 1.0
 
+    def test_deserialize_unknown_decision_raises(self):
+        with pytest.raises(ValueError):
+            self.serializer.deserialize(
+                {"decision": "maybe"}
+            )
+
 
 class TestEventSerializer:
 
@@ -196,3 +208,40 @@ class TestEventSerializer:
         event = self.serializer.deserialize({})
         assert event.type == EventType.INPUT_RECEIVED
         assert event.messages == []
+
+
+class TestJsonCodec:
+
+    def test_encode_returns_bytes(self):
+        raw = encode_json({"a": 1, "b": [True, None]})
+        assert isinstance(raw, bytes)
+        assert json.loads(raw) == {
+            "a": 1,
+            "b": [True, None],
+        }
+
+    def test_encode_enum_values(self):
+        raw = encode_json({"decision": Decision.DENY})
+        assert decode_json(raw) == {"decision": "deny"}
+
+    def test_roundtrip_serialized_verdict(self):
+        data = VerdictSerializer().serialize(
+            Verdict.modify(
+                target="output",
+                operation="replace",
+                value="[REDACTED]",
+            )
+        )
+        assert decode_json(encode_json(data)) == data
+
+    def test_decode_accepts_str_and_bytes(self):
+        assert decode_json('{"x": 1}') == {"x": 1}
+        assert decode_json(b'{"x": 1}') == {"x": 1}
+
+    def test_decode_invalid_raises_json_error(self):
+        with pytest.raises(json.JSONDecodeError):
+            decode_json(b"{not json")
+
+    def test_encode_unsupported_type_raises(self):
+        with pytest.raises(TypeError):
+            encode_json({"x": object()})
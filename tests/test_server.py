@@ -4,7 +4,7 @@ import asyncio
 
 import pytest
 
-from apl.server import PolicyServer
+from apl.server import PolicyServer, VerdictCache
 from apl.server.handler_invoker import (
     invoke_policy_handler,
 )
@@ -135,6 +135,8 @@ class TestPolicyServer:
         verdicts = await server.evaluate(event)
         assert len(verdicts) == 1
         assert verdicts[0].decision == Decision.ALLOW
+        again = await server.evaluate(event)
+        assert again[0] is not verdicts[0]
 
     def test_manifest_generation(self):
         server = PolicyServer(
@@ -159,6 +161,42 @@ class TestPolicyServer:
         assert manifest.policies[0].name == "p1"
         assert manifest.policies[0].version == "2.0"
 
+    def test_manifest_is_reused_until_registry_changes(
+        self,
+    ):
+        server = PolicyServer("memo")
+
+        @server.policy(
+            name="p1", events=["output.pre_send"]
+        )
+        async def p1(event):
+            return Verdict.allow()
+
+        first = server.get_manifest()
+        assert server.get_manifest() is first
+
+        @server.policy(
+            name="p2", events=["input.received"]
+        )
+        async def p2(event):
+            return Verdict.allow()
+
+        second = server.get_manifest()
+        assert second is not first
+        assert len(second.policies) == 2
+
+    def test_manifest_version_bumps_on_register(self):
+        server = PolicyServer("versioned")
+        before = server.manifest_version
+
+        @server.policy(
+            name="p1", events=["output.pre_send"]
+        )
+        async def p1(event):
+            return Verdict.allow()
+
+        assert server.manifest_version == before + 1
+
 
 class TestPolicyRegistry:
 
@@ -176,6 +214,18 @@ class TestPolicyRegistry:
             timeout_ms=1000,
         )
 
+    def test_event_values_precomputed(self):
+        policy = self._make_registered_policy(
+            events=[
+                EventType.OUTPUT_PRE_SEND,
+                EventType.INPUT_RECEIVED,
+            ]
+        )
+        assert policy.event_values == (
+            "output.pre_send",
+            "input.received",
+        )
+
     def test_register_and_retrieve(self):
         reg = PolicyRegistry()
         policy = self._make_registered_policy(
@@ -223,6 +273,70 @@ class TestPolicyRegistry:
         )
         assert len(input_handlers) == 1
 
+    @pytest.mark.asyncio
+    async def test_evaluate_batch_preserves_order(
+        self, make_event
+    ):
+        reg = PolicyRegistry()
+        reg.register(
+            self._make_registered_policy(
+                "out", [EventType.OUTPUT_PRE_SEND]
+            )
+        )
+        events = [
+            make_event(
+                event_type=EventType.OUTPUT_PRE_SEND
+            ),
+            make_event(
+                event_type=EventType.INPUT_RECEIVED
+            ),
+            make_event(
+                event_type=EventType.OUTPUT_PRE_SEND
+            ),
+        ]
+
+        results = await reg.evaluate_batch(events)
+
+        assert len(results) == 3
+        assert results[0][0].policy_name == "out"
+        assert results[1][0].policy_name is None
+        assert results[2][0].policy_name == "out"
+
+    @pytest.mark.asyncio
+    async def test_modification_applies_to_later_policies(
+        self, make_event
+    ):
+        seen: list[str | None] = []
+
+        def redact(event):
+            return Verdict.modify(
+                target="output",
+                operation="redact",
+                value="[REDACTED]",
+            )
+
+        def record(event):
+            seen.append(event.payload.output_text)
+            return Verdict.allow()
+
+        reg = PolicyRegistry()
+        first = self._make_registered_policy("redact")
+        first.handler = redact
+        second = self._make_registered_policy("record")
+        second.handler = record
+        reg.register(first)
+        reg.register(second)
+
+        event = make_event(
+            payload=EventPayload(
+                output_text="secret", tool_name="t"
+            )
+        )
+        await reg.evaluate_event(event)
+
+        assert seen == ["[REDACTED]"]
+        assert event.payload.output_text == "secret"
+
     def test_no_handlers_returns_empty(self):
         reg = PolicyRegistry()
         assert (
@@ -233,6 +347,84 @@ class TestPolicyRegistry:
         )
 
 
+class TestVerdictCache:
+
+    @pytest.mark.asyncio
+    async def test_cached_policy_skips_handler(
+        self, make_event
+    ):
+        server = PolicyServer("cached")
+        calls: list[str] = []
+
+        @server.policy(
+            name="slow-check",
+            events=["output.pre_send"],
+            context=["payload.output_text"],
+            cache_ttl_seconds=60,
+        )
+        async def slow_check(event):
+            calls.append(event.payload.output_text)
+            return Verdict.deny("blocked")
+
+        def event_with(text):
+            return make_event(
+                payload=EventPayload(output_text=text)
+            )
+
+        first = await server.evaluate(event_with("a"))
+        second = await server.evaluate(event_with("a"))
+        await server.evaluate(event_with("b"))
+
+        assert calls == ["a", "b"]
+        assert second[0].decision == Decision.DENY
+        assert second[0].policy_name == "slow-check"
+        assert second[0] is not first[0]
+
+    def test_entries_expire(self, make_event):
+        cache = VerdictCache(
+            ["payload.output_text"], ttl_seconds=0
+        )
+        key = cache.key_for(make_event())
+        cache.put(key, Verdict.allow())
+        assert cache.get(key) is None
+        assert len(cache) == 0
+
+    def test_evicts_least_recently_used(
+        self, make_event
+    ):
+        cache = VerdictCache(
+            ["payload.output_text"],
+            ttl_seconds=60,
+            max_entries=2,
+        )
+        keys = [
+            cache.key_for(
+                make_event(
+                    payload=EventPayload(output_text=t)
+                )
+            )
+            for t in ("a", "b", "c")
+        ]
+        cache.put(keys[0], Verdict.allow())
+        cache.put(keys[1], Verdict.allow())
+        cache.get(keys[0])
+        cache.put(keys[2], Verdict.allow())
+
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[1]) is None
+
+    def test_requires_context_paths(self):
+        server = PolicyServer("cached")
+        with pytest.raises(
+            ValueError, match="context"
+        ):
+            server.policy(
+                name="no-context",
+                events=["output.pre_send"],
+                cache_ttl_seconds=60,
+            )
+
+
 class TestHandlerInvoker:
 
     @pytest.mark.asyncio
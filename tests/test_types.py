@@ -1,5 +1,7 @@
 from __future__ import annotations
 
+from dataclasses import replace
+
 from apl.types import (
     CompositionConfig,
     CompositionMode,
@@ -112,6 +114,56 @@ class TestSessionMetadata:
         assert m.cost_usd == 0.0
 
 
+class TestPolicyEvent:
+
+    def test_latest_user_message(self, make_event):
+        event = make_event(
+            messages=[
+                Message(role="user", content="first"),
+                Message(
+                    role="assistant", content="ok"
+                ),
+                Message(role="user", content="second"),
+                Message(
+                    role="assistant", content="ok"
+                ),
+            ]
+        )
+        assert (
+            event.latest_user_message.content
+            == "second"
+        )
+
+    def test_latest_user_message_none(
+        self, make_event
+    ):
+        event = make_event(
+            messages=[
+                Message(
+                    role="system", content="be nice"
+                )
+            ]
+        )
+        assert event.latest_user_message is None
+
+    def test_latest_user_message_is_cached(
+        self, make_event
+    ):
+        event = make_event(
+            messages=[
+                Message(role="user", content="hi")
+            ]
+        )
+        first = event.latest_user_message
+        event.messages.append(
+            Message(role="user", content="later")
+        )
+        assert event.latest_user_message is first
+
+        copy = replace(event, messages=[])
+        assert copy.latest_user_message is None
+
+
 class TestVerdictFactories:
 
     def test_allow_default(self):
@@ -182,6 +234,12 @@ class TestVerdictFactories:
         v = Verdict.allow(confidence=0.7)
         assert v.confidence == 0.7
 
+    def test_verdict_uses_slots(self):
+        v = Verdict.allow()
+        assert not hasattr(v, "__dict__")
+        v.policy_name = "enriched"
+        assert v.policy_name == "enriched"
+
 
 class TestPolicyDefinition:
 
@@ -0,0 +1,147 @@
+from __future__ import annotations
+
+import asyncio
+import socket
+import subprocess
+import sys
+
+import pytest
+
+from apl.utilities import (
+    kill_process_on_port,
+    kill_processes_on_ports,
+    run_event_loop,
+)
+
+
+class TestRunEventLoop:
+
+    def test_returns_coroutine_result(self):
+        async def compute():
+            await asyncio.sleep(0)
+            return 42
+
+        assert run_event_loop(compute()) == 42
+
+
+LISTENER_SCRIPT = (
+    "import socket, sys, time\n"
+    "s = socket.socket()\n"
+    "s.bind(('127.0.0.1', 0))\n"
+    "s.listen()\n"
+    "print(s.getsockname()[1], flush=True)\n"
+    "time.sleep(60)\n"
+)
+
+
+def _spawn_listener(
+    ignore_sigterm: bool = False,
+) -> tuple[subprocess.Popen, int]:
+    script = LISTENER_SCRIPT
+    if ignore_sigterm:
+        script = (
+            "import signal\n"
+            "signal.signal(signal.SIGTERM, signal.SIG_IGN)\n"
+            + script
+        )
+    proc = subprocess.Popen(
+        [sys.executable, "-c", script],
+        stdout=subprocess.PIPE,
+        text=True,
+    )
+    port = int(proc.stdout.readline())
+    return proc, port
+
+
+@pytest.mark.skipif(
+    not sys.platform.startswith("linux"),
+    reason="exercises the Linux port lookup",
+)
+class TestPortManager:
+
+    def test_kills_listeners_on_multiple_ports(self):
+        first, first_port = _spawn_listener()
+        second, second_port = _spawn_listener()
+        try:
+            assert kill_processes_on_ports(
+                [first_port, second_port]
+            )
+            assert first.wait(timeout=5) is not None
+            assert second.wait(timeout=5) is not None
+        finally:
+            first.kill()
+            second.kill()
+
+    def test_escalates_to_sigkill(self):
+        proc, port = _spawn_listener(
+            ignore_sigterm=True
+        )
+        try:
+            assert kill_process_on_port(port)
+            assert proc.wait(timeout=5) is not None
+        finally:
+            proc.kill()
+
+    def test_free_port_returns_false(self):
+        proc, port = _spawn_listener()
+        proc.kill()
+        proc.wait()
+        assert kill_process_on_port(port) is False
+
+    def test_does_not_target_own_process(self):
+        sock = socket.socket()
+        sock.bind(("127.0.0.1", 0))
+        sock.listen()
+        try:
+            port = sock.getsockname()[1]
+            assert kill_process_on_port(port) is False
+        finally:
+            sock.close()
+
+    def test_empty_port_list(self):
+        assert kill_processes_on_ports([]) is False
+
+
+class TestPortManagerWindows:
+
+    def test_single_taskkill_for_all_pids(
+        self, monkeypatch
+    ):
+        from apl.utilities import port_manager
+
+        netstat = (
+            "  Proto  Local Address  Foreign Address"
+            "  State  PID\n"
+            "  TCP  0.0.0.0:8080  0.0.0.0:0"
+            "  LISTENING  111\n"
+            "  TCP  [::]:8080  [::]:0"
+            "  LISTENING  111\n"
+            "  TCP  127.0.0.1:9090  0.0.0.0:0"
+            "  LISTENING  222\n"
+            "  TCP  127.0.0.1:5000  10.0.0.1:8080"
+            "  ESTABLISHED  333\n"
+            "  UDP  0.0.0.0:8080  *:*  444\n"
+        )
+        calls: list[list[str]] = []
+
+        def fake_run(args, **kwargs):
+            calls.append(args)
+            assert "shell" not in kwargs
+            return subprocess.CompletedProcess(
+                args, 0, stdout=netstat
+            )
+
+        monkeypatch.setattr(sys, "platform", "win32")
+        monkeypatch.setattr(
+            port_manager.subprocess, "run", fake_run
+        )
+
+        assert kill_processes_on_ports([8080, 9090])
+        assert calls[1] == [
+            "taskkill",
+            "/F",
+            "/PID",
+            "111",
+            "/PID",
+            "222",
+        ]